@@ -45,23 +45,48 @@
 # LDIST Approximate distance to the moon
 
 import astro as a
+import numpy as np
 from datetime import datetime, timedelta
-from pytz import timezone
-import logging, json
+import asyncio, functools, logging, json, sys
+from concurrent.futures import ThreadPoolExecutor
 
 logging.basicConfig(format='%(levelname)s:%(message)s', level=logging.INFO)
 
 
+# Shared time formatter for reports; bound once instead of repeating the
+# 'None' ternary and strftime lookup for every field of every row.
+def _fmt(dt):
+    return '' if dt is None else dt.strftime('%H:%M:%S')
+
+
+# Observer construction is not free (the VectorSum initializes internal
+# astrometric tables), and report drivers build one DayCalc per day at the
+# same place, so memoize by position.
+@functools.lru_cache(maxsize=128)
+def _make_loc(latitude, longitude, altitude):
+    topo = a.api.Topos(latitude, longitude, elevation_m=altitude)
+    # CachedObserver reuses the observer state when the searches for
+    # different bodies land on the same time grids.
+    return topo, a.CachedObserver(a.earth + topo)
+
+
 class DayCalc:
     ASTRONOMICAL_TWILIGHT = 0
     NAUTICAL_TWILIGHT     = 1
     CIVIL_TWILIGHT        = 2
+    _RADII                = (18.0, 12.0, 6.0)  # Horizon radius per twilight kind, in kind order
 
     def __init__(self, latitude, longitude, altitude=0, dt=None):
         logging.debug('DayCalc ctor: %s, %s, %s, %s', latitude, longitude, altitude, dt)
         logging.debug('%s, %s, %s, %s', type(latitude), type(longitude), type(altitude), type(dt))
-        self.topo = a.api.Topos(latitude, longitude, elevation_m=altitude)
-        self.loc  = a.earth + self.topo
+        # Bind the hot astro globals once so the inner searches use instance
+        # lookups instead of repeated module attribute chains.
+        self._ts            = a.ts
+        self._sun           = a.sun
+        self._moon          = a.moon
+        self._planets       = a.planets
+        self._find_discrete = a.almanac.find_discrete
+        self.topo, self.loc = _make_loc(latitude, longitude, altitude)
         if dt is None:
             self.DATE = a.time_to_local_datetime(a.now(), self.loc)
         else:
@@ -69,57 +94,152 @@ class DayCalc:
         self.LAT  = latitude
         self.LON  = longitude
         self.ALT  = altitude
+        self._rs_cache = {}  # risings_and_settings closures, keyed by (body, radius, horizon)
         self.init_data()
 
+    # The risings_and_settings closures only depend on the body, radius and
+    # horizon (location is fixed for the life of a DayCalc), so build each one
+    # once and reuse it when many dates are calculated at one location.
+    def _rs(self, body, radius, horizon=-0.3333):
+        key = (id(body), radius, horizon)
+        f   = self._rs_cache.get(key)
+        if f is None:
+            f = self._rs_cache.setdefault(key, a.risings_and_settings(self._planets, body, self.loc, horizon=horizon, radius=radius))
+        return f
+
+    # Maps each lazily-computed field to the method that produces it (and its
+    # siblings). Touching any of these attributes computes just its group, so
+    # a caller that only reads SRISE does not pay for the moon searches.
+    _PRODUCERS = {
+        'BMAT':  '_calc_twilights',        'EEAT':  '_calc_twilights',
+        'BMNT':  '_calc_twilights',        'EENT':  '_calc_twilights',
+        'BMCT':  '_calc_twilights',        'EECT':  '_calc_twilights',
+        'SRISE': '_calc_sun_rise_set',     'SSET':  '_calc_sun_rise_set',
+        'MRISE': '_calc_moon_rise_set',    'MSET':  '_calc_moon_rise_set',
+        'SCUL':  '_calc_sun_culmination',  'SCALT': '_calc_sun_culmination',
+        'LCUL':  '_calc_moon_culmination', 'LCALT': '_calc_moon_culmination',
+        'LPHA':  '_calc_illumination',
+    }
+
+    def __getattr__(self, name):
+        producer = DayCalc._PRODUCERS.get(name)
+        if producer is None:
+            raise AttributeError(name)
+        getattr(self, producer)()
+        return self.__dict__[name]
+
     def init_data(self):
-        self.BMAT  = None,
-        self.BMNT  = None
-        self.BMCT  = None
-        self.SRISE = None
-        self.SCUL  = None
-        self.SCALT = None
-        self.SSET  = None
-        self.EECT  = None
-        self.EENT  = None
-        self.EEAT  = None
-        self.LPHA  = None
-        self.MRISE = None
-        self.LCUL  = None
-        self.LCALT = None
-        self.MSET  = None
+        # Drop any previously computed fields; they are recomputed on demand
+        # by __getattr__ (or all at once by the calc_all flavors).
+        for name in self._PRODUCERS:
+            self.__dict__.pop(name, None)
         self.RDY   = False
+        self._tn   = None  # Time for self.DATE, built on demand by day_time
         self.calc_offset()
 
+    def _local(self, t):
+        return None if t is None else a.time_to_local_datetime(t, self.loc)
+
+    def _store_twilights(self, tw):
+        self.BMAT, self.EEAT = self._local(tw[self.ASTRONOMICAL_TWILIGHT][0]), self._local(tw[self.ASTRONOMICAL_TWILIGHT][1])
+        self.BMNT, self.EENT = self._local(tw[self.NAUTICAL_TWILIGHT][0]),     self._local(tw[self.NAUTICAL_TWILIGHT][1])
+        self.BMCT, self.EECT = self._local(tw[self.CIVIL_TWILIGHT][0]),        self._local(tw[self.CIVIL_TWILIGHT][1])
+
+    def _calc_twilights(self):
+        t0, t1 = self.day_bounds()
+        self._store_twilights(self._all_twilights(t0, t1))
+
+    def _calc_sun_rise_set(self):
+        self.SRISE, self.SSET = self.rise_and_set(self._sun, *self.day_bounds())
+
+    def _calc_moon_rise_set(self):
+        self.MRISE, self.MSET = self.rise_and_set(self._moon, *self.day_bounds())
+
+    def _calc_sun_culmination(self):
+        t0, t1 = self.day_bounds()
+        self.SCUL, self.SCALT = a.culmination(self._sun, self.loc, self.day_time(), t0, t1)
+
+    def _calc_moon_culmination(self):
+        t0, t1 = self.day_bounds()
+        self.LCUL, self.LCALT = a.culmination(self._moon, self.loc, self.day_time(), t0, t1)
+
+    def _calc_illumination(self):
+        self.LPHA = a.almanac.fraction_illuminated(self._planets, 'moon', self.day_time()) * 100.0
+
     def change_date(self, datetime):
         self.DATE = datetime # Local time
         self.init_data()
     
     def calc_offset(self):
-        ta = a.ts.utc(self.DATE.year, self.DATE.month, self.DATE.day, 0, 0, 0)
-        tl = a.time_to_local_datetime(ta, self.loc)
-        self.offset = 24 - tl.hour
+        # self.DATE is timezone-aware, so the UTC offset is already on it;
+        # no need for a Skyfield time build and timezone lookup to find it.
+        # Negated because the offset is the UTC hour of local midnight, and
+        # kept fractional for the half-hour timezones.
+        self.offset = -self.DATE.utcoffset().total_seconds() / 3600.0 % 24.0
         logging.debug('Offset: %s', self.offset)
 
-    def twilight(self, kind):
-        if kind == self.ASTRONOMICAL_TWILIGHT:
-            radius = 18.0
-        elif kind == self.NAUTICAL_TWILIGHT:
-            radius = 12.0
-        elif kind == self.CIVIL_TWILIGHT:
-            radius = 6.0
+    # The Time for self.DATE, built once per date and shared by the calc_all flavors
+    def day_time(self):
+        if self._tn is None:
+            self._tn = self._ts.utc(self.DATE)
+        return self._tn
+
+    # Build the Time objects bounding the local day once, so every search in
+    # calc_all can share them. Each new Time triggers expensive nutation and
+    # precession matrix construction, which dominates Skyfield's cost.
+    def day_bounds(self):
+        t0 = self._ts.utc(self.DATE.year, self.DATE.month, self.DATE.day, self.offset, 0, 0)
+        t1 = self._ts.utc(self.DATE.year, self.DATE.month, self.DATE.day, 23 + self.offset, 59, 59)
+        # Touch the lazily-computed rotation matrices so downstream calls hit the cache
+        _ = t0.gast, t0.MT, t1.gast, t1.MT
+        return t0, t1
+
+    def twilight(self, kind, t0=None, t1=None):
+        f_of_t    = self._rs(self._sun, self._RADII[kind])  # IndexError for a bad kind, as before
+        if t0 is None or t1 is None:
+            t0, t1 = self.day_bounds()
+        return self._find_discrete(t0, t1, f_of_t)
+
+    # All three twilight kinds are crossings of the same sun-altitude curve,
+    # so sample the curve once for the whole day with a single vectorized
+    # observation and pick all six crossings off of it, instead of running
+    # three separate find_discrete bisections.
+    # Returns a list indexed by twilight kind, each entry [dawn, dusk] as
+    # Time objects (None if the sun never crosses that horizon).
+    # A precomputed (grid_tt, alt) curve may be passed in place of t0/t1 when
+    # a batch caller (see series) has already sampled the altitude.
+    def _all_twilights(self, t0, t1, curve=None):
+        horizons = (-0.3333 - 18.0, -0.3333 - 12.0, -0.3333 - 6.0)
+        if curve is None:
+            grid_tt = np.linspace(t0.tt, t1.tt, 289)  # five minute steps
+            alt     = self.loc.at(self._ts.tt_jd(grid_tt)).observe(self._sun).apparent().altaz()[0].degrees
         else:
-            raise IndexError()
-        f_of_t    = a.risings_and_settings(a.planets, a.sun, self.loc, horizon=-0.3333, radius=radius)		
-        day_start = self.DATE
-        day_start = day_start.replace(hour=0, minute=0, second=0)
-        day_end   = self.DATE
-        day_end   = day_end.replace(hour=23, minute=59, second=59)
-        return a.almanac.find_discrete(a.ts.utc(day_start), a.ts.utc(day_end), f_of_t)
-
-    def rise_and_set(self, body):
-        t0        = a.ts.utc(self.DATE.year, self.DATE.month, self.DATE.day, + self.offset, 0, 0)
-        t1        = a.ts.utc(self.DATE.year, self.DATE.month, self.DATE.day, 23 + self.offset, 59, 59)
-        t, y      = a.almanac.find_discrete(t0, t1, a.risings_and_settings(a.planets, body, self.loc, radius=0.5))
+            grid_tt, alt = curve
+        # Bracket every crossing of every horizon on the coarse curve
+        brackets = []  # (kind, rising, index of coarse interval)
+        for kind, h in enumerate(horizons):
+            for i in np.nonzero(np.diff(alt > h))[0]:
+                brackets.append((kind, alt[i] < h, i))
+        results  = [[None, None], [None, None], [None, None]]
+        if brackets:
+            # Refine all the brackets at once with one more vectorized pass
+            fine     = 17
+            fine_tt  = np.concatenate([np.linspace(grid_tt[i], grid_tt[i+1], fine) for _k, _r, i in brackets])
+            fine_alt = self.loc.at(self._ts.tt_jd(fine_tt)).observe(self._sun).apparent().altaz()[0].degrees
+            for n, (kind, rising, _i) in enumerate(brackets):
+                seg_tt  = fine_tt[n*fine:(n+1)*fine]
+                seg_alt = fine_alt[n*fine:(n+1)*fine]
+                h       = horizons[kind]
+                j       = np.nonzero(np.diff(seg_alt > h))[0]
+                j       = j[0] if len(j) else fine - 2
+                frac    = (h - seg_alt[j]) / (seg_alt[j+1] - seg_alt[j])
+                results[kind][0 if rising else 1] = self._ts.tt_jd(seg_tt[j] + frac * (seg_tt[j+1] - seg_tt[j]))
+        return results
+
+    def rise_and_set(self, body, t0=None, t1=None):
+        if t0 is None or t1 is None:
+            t0, t1 = self.day_bounds()
+        t, y      = self._find_discrete(t0, t1, self._rs(body, 0.5))
         rise_time = set_time = None
         assert(0 == a.time_to_local_datetime(t0, self.loc).time().hour)
         for yi, ti in zip(y, t):
@@ -128,32 +248,109 @@ class DayCalc:
             else:
                 set_time  = a.time_to_local_datetime(ti, self.loc)
         # Because of the moon's apparent motion, there are some times it may not rise or set in a given
-        if body == a.moon and not rise_time:
-            t0    = a.ts.utc(self.DATE.year, self.DATE.month, self.DATE.day, + self.offset - 2, 0, 0)
-            t, y  = a.almanac.find_discrete(t0, t1, a.risings_and_settings(a.planets, a.moon, self.loc, radius=0.5))
+        if body == self._moon and not rise_time:
+            t0    = self._ts.utc(self.DATE.year, self.DATE.month, self.DATE.day, + self.offset - 2, 0, 0)
+            t, y  = self._find_discrete(t0, t1, self._rs(self._moon, 0.5))
             t = t[0] if y[0] else t[1]
             rise_time = a.time_to_local_datetime(t, self.loc)
-        elif body == a.moon and not set_time:
-            t1    = a.ts.utc(self.DATE.year, self.DATE.month, self.DATE.day, 23 + self.offset + 2, 59, 59)
-            t, y  = a.almanac.find_discrete(t0, t1, a.risings_and_settings(a.planets, a.moon, self.loc, radius=0.5))
+        elif body == self._moon and not set_time:
+            t1    = self._ts.utc(self.DATE.year, self.DATE.month, self.DATE.day, 23 + self.offset + 2, 59, 59)
+            t, y  = self._find_discrete(t0, t1, self._rs(self._moon, 0.5))
             t = t[0] if y[1] else t[1]
             set_time = a.time_to_local_datetime(t, self.loc)
         return rise_time, set_time
 
-    def calc_all(self):
-        times, _kinds = self.twilight(self.ASTRONOMICAL_TWILIGHT)
-        self.BMAT, self.EEAT    = a.time_to_local_datetime(times[0], self.loc), a.time_to_local_datetime(times[1], self.loc)
-        times, _kinds = self.twilight(self.NAUTICAL_TWILIGHT)
-        self.BMNT, self.EENT    = a.time_to_local_datetime(times[0], self.loc), a.time_to_local_datetime(times[1], self.loc)
-        times, _kinds = self.twilight(self.CIVIL_TWILIGHT)
-        self.BMCT, self.EECT    = a.time_to_local_datetime(times[0], self.loc), a.time_to_local_datetime(times[1], self.loc)
-        self.SCUL, self.SCALT   = a.culmination(a.sun,  self.loc, a.ts.utc(self.DATE))
-        self.LCUL, self.LCALT   = a.culmination(a.moon, self.loc, a.ts.utc(self.DATE))
-        self.SRISE, self.SSET   = self.rise_and_set(a.sun)
-        self.MRISE, self.MSET   = self.rise_and_set(a.moon)
-        self.LPHA               = a.almanac.fraction_illuminated(a.planets, 'moon', a.ts.utc(self.DATE)) * 100.0
+    # Store the results of the seven independent searches; shared by the
+    # serial and async flavors of calc_all.
+    def _store_results(self, twilights, scul, lcul, srs, mrs, lpha):
+        self.BMAT, self.EEAT    = self._local(twilights[self.ASTRONOMICAL_TWILIGHT][0]), self._local(twilights[self.ASTRONOMICAL_TWILIGHT][1])
+        self.BMNT, self.EENT    = self._local(twilights[self.NAUTICAL_TWILIGHT][0]),     self._local(twilights[self.NAUTICAL_TWILIGHT][1])
+        self.BMCT, self.EECT    = self._local(twilights[self.CIVIL_TWILIGHT][0]),        self._local(twilights[self.CIVIL_TWILIGHT][1])
+        self.SCUL, self.SCALT   = scul
+        self.LCUL, self.LCALT   = lcul
+        self.SRISE, self.SSET   = srs
+        self.MRISE, self.MSET   = mrs
+        self.LPHA               = lpha * 100.0
         self.RDY                = True
 
+    def calc_all(self):
+        # Build the day's Time objects once and share across every search below
+        t0, t1 = self.day_bounds()
+        tn     = self.day_time()
+        self._store_results(
+            self._all_twilights(t0, t1),
+            a.culmination(self._sun,  self.loc, tn, t0, t1),
+            a.culmination(self._moon, self.loc, tn, t0, t1),
+            self.rise_and_set(self._sun, t0, t1),
+            self.rise_and_set(self._moon, t0, t1),
+            a.almanac.fraction_illuminated(self._planets, 'moon', tn))
+
+    # Parallel flavor of calc_all for callers that are not running an event
+    # loop: submit the independent searches to an executor and collect them.
+    # A thread pool is used rather than a process pool because the
+    # ephemeris-laden observer and the search closures do not pickle, and
+    # numpy releases the GIL inside the vectorized observations anyway.
+    # Pass a shared executor when calculating many days to reuse the workers.
+    def calc_all_parallel(self, executor=None):
+        own = executor is None
+        if own:
+            executor = ThreadPoolExecutor(max_workers=4)
+        try:
+            t0, t1  = self.day_bounds()
+            tn      = self.day_time()
+            futures = [
+                executor.submit(self._all_twilights, t0, t1),
+                executor.submit(a.culmination, self._sun,  self.loc, tn, t0, t1),
+                executor.submit(a.culmination, self._moon, self.loc, tn, t0, t1),
+                executor.submit(self.rise_and_set, self._sun, t0, t1),
+                executor.submit(self.rise_and_set, self._moon, t0, t1),
+                executor.submit(a.almanac.fraction_illuminated, self._planets, 'moon', tn),
+            ]
+            self._store_results(*[f.result() for f in futures])
+        finally:
+            if own:
+                executor.shutdown()
+
+    # Async flavor of calc_all: the searches are independent, so run them in
+    # worker threads and let a batch driver overlap several days, e.g.:
+    #   asyncio.run(DayCalc.gather(daycalcs))
+    async def calc_all_async(self):
+        loop   = asyncio.get_event_loop()
+        run    = lambda f, *args: loop.run_in_executor(None, f, *args)
+        t0, t1 = self.day_bounds()
+        tn     = self.day_time()
+        results = await asyncio.gather(
+            run(self._all_twilights, t0, t1),
+            run(a.culmination, self._sun,  self.loc, tn, t0, t1),
+            run(a.culmination, self._moon, self.loc, tn, t0, t1),
+            run(self.rise_and_set, self._sun, t0, t1),
+            run(self.rise_and_set, self._moon, t0, t1),
+            run(a.almanac.fraction_illuminated, self._planets, 'moon', tn))
+        self._store_results(*results)
+
+    # Build a run of consecutive days at one location with one vectorized
+    # sun-altitude sweep over the whole span, instead of sampling day by day.
+    # start is a timezone-aware local datetime; remaining fields stay lazy.
+    # (Like the rest of DayCalc, a DST change inside the span can put an
+    # event an hour off on the changeover day.)
+    @classmethod
+    def series(cls, latitude, longitude, altitude, start, days):
+        daycalcs = [cls(latitude, longitude, altitude, start + timedelta(days=n)) for n in range(days)]
+        t0      = daycalcs[0].day_bounds()[0]
+        t1      = daycalcs[-1].day_bounds()[1]
+        span_tt = np.linspace(t0.tt, t1.tt, 288 * days + 1)  # five minute steps
+        alt     = daycalcs[0].loc.at(a.ts.tt_jd(span_tt)).observe(a.sun).apparent().altaz()[0].degrees
+        for n, dc in enumerate(daycalcs):
+            sl = slice(n * 288, n * 288 + 289)
+            dc._store_twilights(dc._all_twilights(None, None, (span_tt[sl], alt[sl])))
+        return daycalcs
+
+    # Run calc_all_async for a whole batch of DayCalcs concurrently.
+    @staticmethod
+    async def gather(daycalcs):
+        await asyncio.gather(*(dc.calc_all_async() for dc in daycalcs))
+        return daycalcs
+
     def as_json(self):
         d = self.as_dict()
         return json.dumps(d)
@@ -166,45 +363,64 @@ class DayCalc:
         result['LAT']   = round(self.LAT, 5)
         result['LON']   = round(self.LON, 5)
         result['ALT']   = round(self.ALT, 1)
-        result['BMAT']  = '' if self.BMAT is None else self.BMAT.strftime('%H:%M:%S')
-        result['BMNT']  = '' if self.BMNT is None else self.BMNT.strftime('%H:%M:%S')
-        result['BMCT']  = '' if self.BMCT is None else self.BMCT.strftime('%H:%M:%S')
-        result['SRISE'] = '' if self.SRISE is None else self.SRISE.strftime('%H:%M:%S')
-        result['SCUL']  = '' if self.SCUL is None else self.SCUL.strftime('%H:%M:%S')
+        result['BMAT']  = _fmt(self.BMAT)
+        result['BMNT']  = _fmt(self.BMNT)
+        result['BMCT']  = _fmt(self.BMCT)
+        result['SRISE'] = _fmt(self.SRISE)
+        result['SCUL']  = _fmt(self.SCUL)
         result['SCALT'] = round(self.SCALT, 2)
-        result['SSET']  = '' if self.SSET is None else self.SSET.strftime('%H:%M:%S')
-        result['EECT']  = '' if self.EECT is None else self.EECT.strftime('%H:%M:%S')
-        result['EENT']  = '' if self.EENT is None else self.EENT.strftime('%H:%M:%S')
-        result['EEAT']  = '' if self.EEAT is None else self.EEAT.strftime('%H:%M:%S')
+        result['SSET']  = _fmt(self.SSET)
+        result['EECT']  = _fmt(self.EECT)
+        result['EENT']  = _fmt(self.EENT)
+        result['EEAT']  = _fmt(self.EEAT)
         result['LPHA']  = round(self.LPHA, 1)
-        result['MRISE'] = '' if self.MRISE is None else self.MRISE.strftime('%H:%M:%S')
-        result['LCUL']  = '' if self.LCUL is None else self.LCUL.strftime('%H:%M:%S')
+        result['MRISE'] = _fmt(self.MRISE)
+        result['LCUL']  = _fmt(self.LCUL)
         result['LCALT'] = 0.0 if self.LCALT is None else round(self.LCALT, 2)
-        result['MSET']  = '' if self.MSET is None else self.MSET.strftime('%H:%M:%S')
+        result['MSET']  = _fmt(self.MSET)
         return result
 
+    # (label, attribute, time?) rows of the long report, in print order.
+    # Labels carry their own padding to match the historical layout.
+    _REPORT_ROWS = (
+        ('Astronomical Dawn         ', 'BMAT',  True),
+        ('Nautical Dawn             ', 'BMNT',  True),
+        ('Civil Dawn                ', 'BMCT',  True),
+        ('Sunrise                   ', 'SRISE', True),
+        ('Solar Noon Time           ', 'SCUL',  True),
+        ('Solar Noon Alt            ', 'SCALT', False),
+        ('Sunset                    ', 'SSET',  True),
+        ('End Civil Twilight        ', 'EECT',  True),
+        ('End Nautical Twilight     ', 'EENT',  True),
+        ('End Astronomical Twilight ', 'EEAT',  True),
+        ('Lunar illumination %      ', 'LPHA',  False),
+        ('Moon Rise                 ', 'MRISE', True),
+        ('Lunar Culmination         ', 'LCUL',  True),
+        ('Lunar Culmination Alt     ', 'LCALT', False),
+        ('Moon Set                  ', 'MSET',  True),
+    )
+
     def print_report(self):
         if not self.RDY:
             self.calc_all()
-        print('Date                      ', self.DATE.date())
-        print('Lat                       ', str(round(self.LAT, 5)))
-        print('Lon                       ', str(round(self.LON, 5)))
-        print('Alt                       ', str(round(self.ALT, 2)))
-        print('Astronomical Dawn         ', '' if self.BMAT is None else self.BMAT.strftime('%H:%M:%S'))
-        print('Nautical Dawn             ', '' if self.BMNT is None else self.BMNT.strftime('%H:%M:%S'))
-        print('Civil Dawn                ', '' if self.BMCT is None else self.BMCT.strftime('%H:%M:%S'))
-        print('Sunrise                   ', '' if self.SRISE is None else self.SRISE.strftime('%H:%M:%S'))
-        print('Solar Noon Time           ', '' if self.SCUL is None else self.SCUL.strftime('%H:%M:%S'))
-        print('Solar Noon Alt            ', round(self.SCALT, 2))
-        print('Sunset                    ', '' if self.SSET is None else self.SSET.strftime('%H:%M:%S'))
-        print('End Civil Twilight        ', '' if self.EECT is None else self.EECT.strftime('%H:%M:%S'))
-        print('End Nautical Twilight     ', '' if self.EENT is None else self.EENT.strftime('%H:%M:%S'))
-        print('End Astronomical Twilight ', '' if self.EEAT is None else self.EEAT.strftime('%H:%M:%S'))
-        print('Lunar illumination %      ', round(self.LPHA, 1))
-        print('Moon Rise                 ', '' if self.MRISE is None else self.MRISE.strftime('%H:%M:%S'))
-        print('Lunar Culmination         ', '' if self.LCUL is None else self.LCUL.strftime('%H:%M:%S'))
-        print('Lunar Culmination Alt     ', 0.0 if self.LCALT is None else round(self.LCALT, 2))
-        print('Moon Set                  ', '' if self.MSET is None else self.MSET.strftime('%H:%M:%S'))
+        # Collect the whole report and write it with one syscall instead of
+        # one print (and one stdout lock) per line.
+        lines = [
+            'Date                       {0}'.format(self.DATE.date()),
+            'Lat                        {0}'.format(round(self.LAT, 5)),
+            'Lon                        {0}'.format(round(self.LON, 5)),
+            'Alt                        {0}'.format(round(self.ALT, 2)),
+        ]
+        for label, attr, is_time in self._REPORT_ROWS:
+            value = getattr(self, attr)
+            if is_time:
+                value = _fmt(value)
+            elif value is None:
+                value = 0.0
+            else:
+                value = round(value, 1 if 'LPHA' == attr else 2)
+            lines.append('{0} {1}'.format(label, value))
+        sys.stdout.write('\n'.join(lines) + '\n')
 
     def print_report_header(self, fixed = True):
         print('For latitude {0}, longitude {1}, at {2} meters:'.format(self.LAT, self.LON, self.ALT))
@@ -226,21 +442,21 @@ class DayCalc:
         fmt = fixed_format if fixed else tabbed_format
         print(fmt.format(
             self.DATE.date(),
-            '' if self.BMAT  is None else self.BMAT.strftime('%H:%M:%S'),
-            '' if self.BMNT  is None else self.BMNT.strftime('%H:%M:%S'),
-            '' if self.BMCT  is None else self.BMCT.strftime('%H:%M:%S'),
-            '' if self.SRISE is None else self.SRISE.strftime('%H:%M:%S'),
-            '' if self.SCUL  is None else self.SCUL.strftime('%H:%M:%S'),
+            _fmt(self.BMAT),
+            _fmt(self.BMNT),
+            _fmt(self.BMCT),
+            _fmt(self.SRISE),
+            _fmt(self.SCUL),
             0.0 if self.SCALT    is None else round(self.SCALT, 2),
-            '' if self.SSET  is None else self.SSET.strftime('%H:%M:%S'),
-            '' if self.EECT  is None else self.EECT.strftime('%H:%M:%S'),
-            '' if self.EENT  is None else self.EENT.strftime('%H:%M:%S'),
-            '' if self.EEAT  is None else self.EEAT.strftime('%H:%M:%S'),
+            _fmt(self.SSET),
+            _fmt(self.EECT),
+            _fmt(self.EENT),
+            _fmt(self.EEAT),
             0.0 if self.LPHA     is None else round(self.LPHA, 1),
-            '' if self.MRISE is None else self.MRISE.strftime('%H:%M:%S'),
-            '' if self.LCUL  is None else self.LCUL.strftime('%H:%M:%S'),
+            _fmt(self.MRISE),
+            _fmt(self.LCUL),
             0.0 if self.LCALT    is None else round(self.LCALT, 2),
-            '' if self.MSET  is None else self.MSET.strftime('%H:%M:%S')
+            _fmt(self.MSET)
         ))
 
 if '__main__' == __name__:
@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
 import astro as a
 from timezonefinder import TimezoneFinder
-from datetime import datetime, time, timedelta
+from datetime import datetime, time, timedelta, timezone as _timezone
 from math import pi, cos, sin, radians
+import functools, threading
+import numpy as np
 import pytz
 
 # Given the UTC time, latitude and longitude, create a TimeCalc object
@@ -13,33 +15,126 @@ import pytz
 #
 # Raw Astro data: {"lon": -122.180122359, "mode": 3, "time": "2019-10-20T22:02:53.000Z", "lat": 47.725316405, "alt": 102.793, "speed": 0.628, "climb": 0.596}
 
+_finder      = None
+_finder_lock = threading.Lock()
+
+
+def _get_finder():
+    # TimezoneFinder mmaps and parses large polygon files on construction,
+    # and is read-only afterwards, so share one lazily-built instance across
+    # every TimeCalc instead of rebuilding per object.
+    global _finder
+    if _finder is None:
+        with _finder_lock:
+            if _finder is None:
+                _finder = TimezoneFinder()
+    return _finder
+
+
+# The polygon search is the expensive part of a timezone lookup; memoize it
+# on coordinates rounded to ~10 m so GPS jitter still hits the cache.
+@functools.lru_cache(maxsize=4096)
+def _timezone_at(lat, lon):
+    return _get_finder().timezone_at(lat=lat, lng=lon)
+
+
+# Numeric cores of the Equation of Time, hoisted to module scope so the
+# getter methods are thin wrappers and the trig runs with plain locals.
+def _eot_simple(doy):
+    B = radians((360.0 / 365.0) * (doy - 81))
+    return (9.87 * sin(2 * B)) - (7.53 * cos(B)) - (1.5 * sin(B))
+
+
+def _eot_pvlib(doy):
+    # From https://github.com/pvlib/pvlib-python/blob/master/pvlib/solarposition.py
+    day_angle = (2. * pi / 365.) * (doy - 1)
+    return (1440.0 / 2 / pi) * (
+        0.0000075 +
+        0.001868 * cos(day_angle) - 0.032077 * sin(day_angle) -
+        0.014615 * cos(2.0 * day_angle) - 0.040849 * sin(2.0 * day_angle)
+    )
+
+
+# There are only 366 possible day-of-year values, so tabulate both Equation
+# of Time formulas once at import; the getters then cost one index instead
+# of four transcendentals per call.
+_EOT_TABLE  = [_eot_simple(d) for d in range(367)]
+_EOT2_TABLE = [_eot_pvlib(d) for d in range(367)]
+
+
+# The GPS/Skyfield timestamps have a fixed ISO-8601 shape, so skip strptime's
+# format-string state machine. fromisoformat is a C-level fast path; Pythons
+# before 3.11 don't accept the trailing 'Z', hence the fallback.
+# The 25 possible Etc/GMT fallback zone names, prebuilt; index by part+12.
+_ETC_NAMES = tuple('Etc/GMT' if 0 == p else 'Etc/GMT{0:+d}'.format(p) for p in range(-12, 13))
+
+
+def _parse_iso(s):
+    try:
+        return datetime.fromisoformat(s)
+    except ValueError:
+        if s.endswith('Z'):
+            return datetime.fromisoformat(s[:-1]).replace(tzinfo=_timezone.utc)
+        raise
+
+
 class TimeCalc:
     # If utc parameter is not overridden, the current time is used.
     def __init__(self, lat, lon, utc=None):
         if utc is None:
             utc = a.now().utc_datetime()
         if isinstance(utc, str):
-            utc      = datetime.strptime(utc, "%Y-%m-%dT%H:%M:%S.%f%z")
+            utc      = _parse_iso(utc)
         self.utc     = utc
-        self.t       = a.ts.utc(utc)
+        self.t       = None  # Skyfield Time, built on demand by getTime()
         self.lat     = float(lat)
         self.lon     = float(lon)
-        self.finder  = TimezoneFinder()
-        self.tzName  = ''  # Compute the name on demand.
-    
+        self.tzName  = ''    # Compute the name on demand.
+        self._tz     = None  # tzinfo object, cached beside the name
+        self._local  = None  # Local datetime of self.utc, cached by getLocalTime
+
     def change_location(self, lat, lon):
         self.lat     = float(lat)
         self.lon     = float(lon)
-        self.tzName  = ''  # Compute the name on demand.
-    
+        self.tzName  = ''    # Compute the name on demand.
+        self._tz     = None
+        self._local  = None
+
     def change_time(self, utc):
         self.utc     = utc
-        self.t       = a.ts.utc(utc)
+        self.t       = None  # Rebuilt on demand by getTime()
+        self._local  = None
+
+    def getTime(self):
+        # Only the sidereal/JDate getters need the Skyfield Time, so build it
+        # lazily; a plain local-time conversion then skips the round trip of
+        # datetime -> Time on every change_time.
+        if self.t is None:
+            # Hand Skyfield plain components; the datetime overload routes
+            # through a slower generic conversion path.
+            u = self.utc
+            if u.utcoffset():
+                u = u.astimezone(_timezone.utc)
+            self.t = a.ts.utc(u.year, u.month, u.day, u.hour, u.minute,
+                              u.second + u.microsecond * 1e-6)
+        return self.t
+
+    # Sidereal times for a whole run of moments at once. One Skyfield Time
+    # built from the list of UTC datetimes computes GMST vectorized inside
+    # numpy, instead of paying the full nutation pipeline per TimeCalc.
+    # lon may be a scalar or an array matching utcs.
+    # Returns (gmst, lmst) as arrays of decimal hours.
+    @classmethod
+    def batch_sidereal(cls, lon, utcs):
+        t    = a.ts.utc(utcs)
+        gmst = t.gmst
+        lmst = (gmst + np.asarray(lon) * 24.0 / 360.0) % 24.0
+        return gmst, lmst
 
     def getTimeZoneName(self):
         if '' == self.tzName:
             # Set tzName to string or None; do only once.
-            tzName = self.finder.timezone_at(lat=self.lat, lng=self.lon)
+            tzName = _timezone_at(round(self.lat, 4), round(self.lon, 4))
             if tzName is None:
                 # Per https://en.wikipedia.org/wiki/Tz_database#Area
                 # Generic timezones are in the Etc/ Area, and have thier signs reversed.
@@ -48,33 +143,39 @@ class TimeCalc:
                 part = -int(self.lon/15)
                 assert(-12 <= part <= 12)
                 #print(self.lon, part)
-                if not part:
-                    tzName = 'Etc/GMT'
-                else:
-                    if part > 0:
-                        tzName = 'Etc/GMT+' + str(part)
-                    else:
-                        tzName = 'Etc/GMT' + str(part)
+                tzName = _ETC_NAMES[part + 12]
             self.tzName = tzName
         return self.tzName
 
     def getDOY(self, dt):
         # Get the Day of Year of the datetime provided
-        return dt.timetuple().tm_yday
+        # Closed form; avoids the struct_time allocation of timetuple()
+        return (dt - dt.replace(month=1, day=1)).days + 1
 
     def getUtcTime(self):
         return self.utc
 
+    def getTimeZone(self):
+        # pytz.timezone re-parses zone data on a cold cache and does a dict
+        # probe even when warm; keep the tzinfo object beside the name.
+        if self._tz is None:
+            self._tz = pytz.timezone(self.getTimeZoneName())
+        return self._tz
+
     def getLocalTime(self):
-        tz = pytz.timezone(self.getTimeZoneName())
-        return self.utc.astimezone(tz)
+        # Cached: a single report asks for local time half a dozen times
+        # (getSolarTime, getEoT, getDOY, the print itself) and each astimezone
+        # is a fresh pytz DST lookup.
+        if self._local is None:
+            self._local = self.utc.astimezone(self.getTimeZone())
+        return self._local
 
     def getJDate(self):
-        return self.t._utc_float()
+        return self.getTime()._utc_float()
 
     def getGMST(self):
         # Greenwich Mean Sidereal Time
-        return self.t.gmst
+        return self.getTime().gmst
 
     def getLMST(self):
         # Local Mean Sidereal Time
@@ -85,25 +186,16 @@ class TimeCalc:
 
     def getLocalTimeOffset(self):
         # Get the difference between UTC al Local Time
-        return float(self.getLocalTime().strftime('%z')) / 100.0
+        # Straight from the tzinfo; no formatting to '%z' and parsing back
+        return self.getLocalTime().utcoffset().total_seconds() / 3600.0
 
     def getEoT(self):
         # Get the Equation of Time; how many minutes ahead or behind mean time the Sun is
-        LT   = self.getLocalTime()
-        B    = radians((360.0 / 365.0) * ((self.getDOY(LT)) - 81))
-        EoT  = (9.87 * sin(2 * B)) - (7.53 * cos(B)) - (1.5 * sin(B))
-        return EoT
+        return _EOT_TABLE[self.getDOY(self.getLocalTime())]
 
     def getEoT2(self):
-        # From https://github.com/pvlib/pvlib-python/blob/master/pvlib/solarposition.py
-        dayofyear = self.getDOY(self.getLocalTime())
-        day_angle = (2. * pi / 365.) * (dayofyear - 1)
-        eot = (1440.0 / 2 / pi) * (
-            0.0000075 +
-            0.001868 * cos(day_angle) - 0.032077 * sin(day_angle) -
-            0.014615 * cos(2.0 * day_angle) - 0.040849 * sin(2.0 * day_angle)
-        )
-        return eot
+        # Equation of Time using the pvlib coefficients
+        return _EOT2_TABLE[self.getDOY(self.getLocalTime())]
 
     def getSolarTime(self):
         # Difference between local and solar time in minutes.
@@ -112,17 +204,18 @@ class TimeCalc:
         LT   = self.getLocalTime()
         TD   = int(self.lon * 24.0 / 360.0)
         LSTM = TD * 15.0
-        EoT  = self.getEoT()
+        EoT  = _EOT_TABLE[self.getDOY(LT)]  # getEoT inlined; reuses LT
         TC   = 4 * (self.lon - LSTM) + EoT
         LST  = LT + timedelta(minutes=TC)
-        if LT.dst().seconds != 0:
+        if LT.dst().total_seconds() != 0:
             LST -= timedelta(hours=1)
         return LST
 
     def decimalHoursToHMS(self, h):
-        hour = int(h)
-        min  = int((h - hour) * 60.0)
-        sec  = int(((h - hour) - (min / 60.0)) * 3600.0)
+        # One integer pipeline instead of repeated float fractions; also
+        # avoids the rounding drift of subtracting min/60.0 back out.
+        hour, rem = divmod(int(h * 3600.0), 3600)
+        min, sec  = divmod(rem, 60)
         return '{0:02d}:{1:02d}:{2:02d}'.format(hour, min, sec)
 
     def print_report(self):
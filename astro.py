@@ -57,7 +57,8 @@
 # astro.risings_and_settings(ephemeris, target, topos, horizon, radius)  Calc rise/set for any body
 
 
-import math, logging, json, calendar, TimeCalc
+import math, functools, logging, json, calendar, sys, threading, TimeCalc
+import numpy as np
 from skyfield             import api, almanac
 from skyfield.api         import Star
 from skyfield.data        import hipparcos
@@ -73,25 +74,37 @@ LOG_LEVEL       = logging.INFO
 ROUNDING        = 3
 
 data_dir        = '/usr/local/share/skyfield/data'
+_MONTH_DAYS     = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)  # Non-leap; month_end patches February
 _time_calc      = None  # Access through get_TimeCalc. Instance is cached. Use change_location freely.
+_time_calc_lock = threading.RLock()  # The cached TimeCalc is shared; serialize access for threaded callers
 
 logging.basicConfig(format='%(levelname)s:%(message)s', level=LOG_LEVEL)
 
 
 def haversine(lat1, lon1, lat2, lon2, metric=False):
     """
-    Calculate the great circle distance between two points 
-    on the earth (specified in decimal degrees)
+    Calculate the great circle distance between two points
+    on the earth (specified in decimal degrees).
+    Arguments may be scalars or numpy arrays; arrays go through numpy's
+    vectorized ufuncs, while scalars keep the cheaper math.* path used by
+    get_TimeCalc's single-point distance check.
     """
-    # convert decimal degrees to radians 
+    r = 6371 if metric else 3956 # radius of the Earth
+    if np.ndim(lat1) or np.ndim(lon1) or np.ndim(lat2) or np.ndim(lon2):
+        lon1, lat1, lon2, lat2 = map(np.radians, [lon1, lat1, lon2, lat2])
+        dlon = lon2 - lon1
+        dlat = lat2 - lat1
+        a = np.sin(dlat/2)**2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon/2)**2
+        return 2 * r * np.arcsin(np.sqrt(a))
+
+    # convert decimal degrees to radians
     lon1, lat1, lon2, lat2 = map(radians, [lon1, lat1, lon2, lat2])
 
-    # haversine formula 
-    dlon = lon2 - lon1 
-    dlat = lat2 - lat1 
+    # haversine formula
+    dlon = lon2 - lon1
+    dlat = lat2 - lat1
     a = sin(dlat/2)**2 + cos(lat1) * cos(lat2) * sin(dlon/2)**2
     c = 2 * asin(sqrt(a))
-    r = 6371 if metric else 3956 # radius of the Earth
     return c * r
 
 
@@ -99,96 +112,240 @@ def haversine(lat1, lon1, lat2, lon2, metric=False):
 def get_TimeCalc(lat, lon, t=None):
     global _time_calc
     if t is None: t = now()
-    if _time_calc is None:
-        _time_calc = TimeCalc.TimeCalc(lat, lon, t.utc_datetime())
-    else:
-        # Don't change location unless needed. Timezone is cached.
-        # Check to see if distance is > 1 mile from current settings.
-        # change if greater, leave as is for less.
-        # TODO: distance should be a settings.  Need -force param.
-        # TODO: should this calc move to TimeCalc?
-        # lat/lon may be identical, call after call, optimize for this
-        if lat != _time_calc.lat or lon != _time_calc.lon:
-            # If there's a change, it may be jitter, or too small to matter.
-            dist = haversine(lat, lon, _time_calc.lat, _time_calc.lon)
-            if TIME_ZONE_DIST < dist:
-                logging.debug('Changing TimeCalc loc because distance is %s', dist)
-                _time_calc.change_location(lat, lon)
-            else:
-                logging.debug('Keeping cached location because distance change is %s', dist)
-                pass
-        _time_calc.change_time(t.utc_datetime())
-    return _time_calc
-
-
+    with _time_calc_lock:
+        if _time_calc is None:
+            _time_calc = TimeCalc.TimeCalc(lat, lon, t.utc_datetime())
+        else:
+            # Don't change location unless needed. Timezone is cached.
+            # Check to see if distance is > 1 mile from current settings.
+            # change if greater, leave as is for less.
+            # TODO: distance should be a settings.  Need -force param.
+            # TODO: should this calc move to TimeCalc?
+            # lat/lon may be identical, call after call, optimize for this
+            if lat != _time_calc.lat or lon != _time_calc.lon:
+                # If there's a change, it may be jitter, or too small to matter.
+                # Squared-degrees pre-check: anything under ~1 mile (0.0145 deg)
+                # can't pass the haversine test below, so skip the trig for it.
+                dlat = lat - _time_calc.lat
+                dlon = lon - _time_calc.lon
+                if 2e-4 <= dlat * dlat + dlon * dlon:
+                    dist = haversine(lat, lon, _time_calc.lat, _time_calc.lon)
+                    if TIME_ZONE_DIST < dist:
+                        logging.debug('Changing TimeCalc loc because distance is %s', dist)
+                        _time_calc.change_location(lat, lon)
+                    else:
+                        logging.debug('Keeping cached location because distance change is %s', dist)
+            utc = t.utc_datetime()
+            if utc != _time_calc.utc:
+                _time_calc.change_time(utc)
+        return _time_calc
+
+
+# Both lookups use the tables built below, once the planet globals exist.
+# Keyed by id() because Skyfield segment comparison is not a cheap test;
+# the globals are the only instances these functions are ever handed.
 def name_from_body(body):
-    if (sun      == body): return 'Sun'
-    elif(moon    == body): return 'Moon'
-    elif(mercury == body): return 'Mercury'
-    elif(venus   == body): return 'Venus'
-    elif(earth   == body): return 'Earth'
-    elif(mars    == body): return 'Mars'
-    elif(jupiter == body): return 'Jupiter'
-    elif(saturn  == body): return 'Saturn'
-    elif(uranus  == body): return 'Uranus'
-    elif(neptune == body): return 'Neptune'
-    elif(pluto   == body): return 'Pluto'
-    else:                  return 'Unknown'
+    _load()
+    return _NAME_FROM_ID.get(id(body), 'Unknown')
 
 
 def body_from_name(name):
     if not isinstance(name, str): return None
-    name = name.lower()
-    if ('sun'      == name): return sun
-    elif('moon'    == name): return moon
-    elif('mercury' == name): return mercury
-    elif('venus'   == name): return venus
-    elif('earth'   == name): return earth
-    elif('mars'    == name): return mars
-    elif('jupiter' == name): return jupiter
-    elif('saturn'  == name): return saturn
-    elif('uranus'  == name): return uranus
-    elif('neptune' == name): return neptune
-    elif('pluto'   == name): return pluto
-    else:                    return None
+    _load()
+    return _BODY_FROM_NAME.get(name.lower())
+
+
+_constellation_at = None  # Loaded once on first use by pos_to_constellation
+_const_cache      = {}    # (ra, dec) rounded to ~4 arcsec -> constellation
 
 
 def pos_to_constellation(pos):
-    constellation_at = api.load_constellation_map()
-    return constellation_at(pos)
+    # load_constellation_map re-reads and parses the boundary file each
+    # call, and print_planets asks once per body; load it a single time.
+    # The lookup itself is then memoized on milli-rounded coordinates:
+    # constellation boundaries are degrees across, so repeat queries for a
+    # body at nearby times land on the same key and skip the search.
+    global _constellation_at
+    if _constellation_at is None:
+        _constellation_at = api.load_constellation_map()
+    ra, dec, _ = pos.radec()
+    key = (round(ra.hours, 3), round(dec.degrees, 3))
+    hit = _const_cache.get(key)
+    if hit is None:
+        if 4096 <= len(_const_cache):
+            _const_cache.clear()
+        hit = _const_cache[key] = _constellation_at(pos)
+    return hit
+
+
+# Give t the truncated iau2000b nutation series, but only if the Time has
+# not computed angles already. The searches hand the same Time objects to
+# every body's callback, so after the first body this is a dict probe
+# instead of a fresh series evaluation. (Checked via __dict__ because
+# reading the attribute would trigger the full iau2000a computation.)
+#
+# The series itself is evaluated on times rounded to ~14-minute buckets
+# and memoized, so the identical coarse grids find_discrete probes for
+# each of ten bodies share one evaluation even though each search builds
+# fresh Time objects. Nutation changes sub-mas over a bucket, well under
+# what a horizon-crossing test can see.
+_nut_cache = {}
+
+
+def _ensure_nutation(t):
+    if '_nutation_angles' not in t.__dict__:
+        tt     = np.round(np.asarray(t.tt) * 100.0) / 100.0
+        key    = tt.tobytes()
+        angles = _nut_cache.get(key)
+        if angles is None:
+            if 512 <= len(_nut_cache):
+                _nut_cache.clear()
+            angles = _nut_cache[key] = iau2000b(tt)
+        t._nutation_angles = angles
+    return t
 
 
 # From: https://github.com/skyfielders/python-skyfield/blob/master/skyfield/almanac.py
 def risings_and_settings(ephemeris, target, observer, horizon=-0.3333, radius=0):
     h = horizon - radius
     def is_body_up_at(t):
-        t._nutation_angles = iau2000b(t.tt)
+        _ensure_nutation(t)
         return observer.at(t).observe(target).apparent().altaz()[0].degrees > h
     is_body_up_at.rough_period = 0.5  # twice a day
     return is_body_up_at
 
 
-# From https://github.com/skyfielders/python-skyfield/issues/243
-def culmination(body, observer, t):
-    def f(t):
-        alt, _az, _distance = observer.at(t).observe(body).apparent().altaz()
-        return alt.degrees
-    f.rough_period = 1.0
-
+# Vectorized rise/set search: sample the body's altitude across [t0, t1]
+# on a five-minute grid with one broadcast observation, bracket the horizon
+# crossings in numpy, then refine every bracket with a single finer pass.
+# Same approach as DayCalc._all_twilights; replaces the many scalar probes
+# of a find_discrete bisection. Returns (rise, set) as Time objects, either
+# of which may be None if the body never crosses the horizon in the span.
+# A caller sweeping several bodies over the same span (print_planets) may
+# pass grid, a Time array covering [t0, t1], so every body reuses one set
+# of grid Times and the observer states cached against them. curve may
+# carry an already-sampled (grid_tt, alt) pair, in which case the coarse
+# observation is skipped entirely (info shares one curve with culmination).
+def rise_and_set(target, observer, t0, t1, horizon=-0.3333, radius=0.0, grid=None, curve=None):
+    _load()
+    h = horizon - radius
+    if curve is None:
+        if grid is None:
+            grid = _ensure_nutation(ts.tt_jd(np.linspace(t0.tt, t1.tt, 289)))
+        curve = (grid.tt, observer.at(grid).observe(target).apparent().altaz()[0].degrees)
+    grid_tt, alt = curve
+    rise    = sett = None
+    idx     = np.nonzero(np.diff(alt > h))[0]
+    if len(idx):
+        fine     = 17
+        fine_tt  = np.concatenate([np.linspace(grid_tt[i], grid_tt[i+1], fine) for i in idx])
+        fine_alt = observer.at(_ensure_nutation(ts.tt_jd(fine_tt))).observe(target).apparent().altaz()[0].degrees
+        for n, i in enumerate(idx):
+            seg_tt  = fine_tt[n*fine:(n+1)*fine]
+            seg_alt = fine_alt[n*fine:(n+1)*fine]
+            j       = np.nonzero(np.diff(seg_alt > h))[0]
+            j       = j[0] if len(j) else fine - 2
+            frac    = (h - seg_alt[j]) / (seg_alt[j+1] - seg_alt[j])
+            ti      = ts.tt_jd(seg_tt[j] + frac * (seg_tt[j+1] - seg_tt[j]))
+            if alt[i] < h:
+                rise = ti
+            else:
+                sett = ti
+    return rise, sett
+
+
+# Wrap an observer so repeated .at(t) calls with an identical Time reuse the
+# computed state. The observer's position depends only on t, but each body's
+# search re-evaluates it on the same time grids, so across the searches of a
+# day most .at() calls are repeats. Keyed on the underlying tt value rather
+# than object identity so recycled Time objects cannot alias. All other
+# attribute access is delegated to the wrapped observer.
+class CachedObserver(object):
+    def __init__(self, observer, size=16):
+        self.observer = observer
+        self._size    = size
+        self._cache   = {}
+    def _key(self, t):
+        tt = t.tt
+        return tt.tobytes() if hasattr(tt, 'tobytes') else tt
+    def at(self, t):
+        key = self._key(t)
+        hit = self._cache.get(key)
+        if hit is None:
+            if len(self._cache) >= self._size:
+                self._cache.clear()
+            hit = self._cache[key] = self.observer.at(t)
+        return hit
+    def __getattr__(self, name):
+        return getattr(self.observer, name)
+
+
+# Analytic estimate of local solar noon for the day of t, as a UTC Time.
+# Uses the Equation of Time approximation (same series as TimeCalc.getEoT);
+# good to a minute or so, which is plenty to seed a culmination search.
+def solar_noon_estimate(observer, t):
+    _load()
+    lat, lon = lat_lon_from_observer(observer)
     dt   = t.utc_datetime()
-    # Determine time offset for the day (TODO: may be 1 hour off on DST change dates)
-    ta = ts.utc(dt.year, dt.month, dt.day, 0, 0, 0)
-    tl = time_to_local_datetime(ta, observer)
-    offset = 24 - tl.hour
-
-    t0   = ts.utc(dt.year, dt.month, dt.day,  offset,  0,  0)
-    t1   = ts.utc(dt.year, dt.month, dt.day, 23 + offset, 59, 59)
-    assert(0 == time_to_local_datetime(t0, observer).time().hour)
+    doy  = dt.timetuple().tm_yday
+    B    = radians((360.0 / 365.0) * (doy - 81))
+    eot  = (9.87 * sin(2 * B)) - (7.53 * cos(B)) - (1.5 * sin(B))  # minutes
+    noon = 12.0 - lon / 15.0 - eot / 60.0  # decimal hours UTC
+    return ts.utc(dt.year, dt.month, dt.day, noon)
+
+
+# From https://github.com/skyfielders/python-skyfield/issues/243
+# t0 and t1 may be passed in to share a caller's Time objects (see DayCalc);
+# if omitted they are built here to bound the local day of t.
+# curve may carry a (grid_tt, alt) day sweep already computed by the caller
+# (info samples one for rise/set); the peak is then read off of it with no
+# further observations. Ignored for the sun, whose narrow analytic bracket
+# is both cheaper and finer than a whole-day grid.
+def culmination(body, observer, t, t0=None, t1=None, curve=None):
+    _load()
+    if body is sun:
+        # The sun's culmination is known analytically to within a minute or
+        # so, so search a narrow bracket around the estimate instead of
+        # scanning the whole day.
+        noon  = solar_noon_estimate(observer, t)
+        t0    = ts.tt_jd(noon.tt - 1.5 / 24.0)
+        t1    = ts.tt_jd(noon.tt + 1.5 / 24.0)
+        curve = None
+    elif curve is None and (t0 is None or t1 is None):
+        dt   = t.utc_datetime()
+        # Determine time offset for the day (TODO: may be 1 hour off on DST change dates)
+        ta = ts.utc(dt.year, dt.month, dt.day, 0, 0, 0)
+        tl = time_to_local_datetime(ta, observer)
+        offset = 24 - tl.hour
+
+        t0   = ts.utc(dt.year, dt.month, dt.day,  offset,  0,  0)
+        t1   = ts.utc(dt.year, dt.month, dt.day, 23 + offset, 59, 59)
+        assert(0 == time_to_local_datetime(t0, observer).time().hour)
     try:
-        times, maxima = almanac._find_maxima(t0, t1, f, epsilon=0.000001) # tuned to avoid exceptions
-        t   = time_to_local_datetime(times[0], observer)
-        alt = maxima[0]
-        return (t, alt)
+        # Sample the altitude across the whole bracket in a single vectorized
+        # observation, then refine the peak with a three-point parabolic fit.
+        # This replaces _find_maxima's one-scalar-observe-per-sample loop.
+        if curve is None:
+            grid_tt = np.linspace(t0.tt, t1.tt, 145)
+            grid_t  = ts.tt_jd(grid_tt)
+            # Same shortcut risings_and_settings uses: the truncated iau2000b
+            # nutation series is far cheaper than the full default series and
+            # plenty accurate for peak finding.
+            _ensure_nutation(grid_t)
+            alt = observer.at(grid_t).observe(body).apparent().altaz()[0].degrees
+        else:
+            grid_tt, alt = curve
+        i       = int(np.argmax(alt))
+        if 0 == i or len(alt) - 1 == i:
+            # Peak is at the bracket edge: the transit is outside the window
+            # (the moon can do this), which the old search also gave up on.
+            return None, None
+        y0, y1, y2 = alt[i-1], alt[i], alt[i+1]
+        denom      = y0 - 2.0 * y1 + y2
+        shift      = 0.0 if 0.0 == denom else 0.5 * (y0 - y2) / denom
+        peak_tt    = grid_tt[i] + shift * (grid_tt[1] - grid_tt[0])
+        peak_alt   = y1 - 0.25 * (y0 - y2) * shift
+        return (time_to_local_datetime(ts.tt_jd(peak_tt), observer), peak_alt)
     except:
         return None, None
 
@@ -202,22 +359,50 @@ def lat_lon_from_observer(observer):
     return lat, lon
 
 
+# time_to_local_datetime and the calendar-boundary helpers below are pure
+# functions of (instant, observer location), but info() re-runs them for
+# every body of a report — twenty timezone round trips and fresh Times per
+# print_planets. Bounded memo keyed on the tt float and observer identity;
+# observers here are long-lived module globals or per-report wrappers, so
+# identity is stable exactly where the reuse happens.
+_boundary_cache = {}
+
+
+def _boundary_memo(kind, t, observer, build):
+    key = (kind, float(t.tt), id(observer))
+    hit = _boundary_cache.get(key)
+    if hit is None:
+        if 256 <= len(_boundary_cache):
+            _boundary_cache.clear()
+        hit = _boundary_cache[key] = build()
+    return hit
+
+
 def time_to_local_datetime(t, observer):
     """Using the location embedded in the observer object, calculate local time from Time object (utc)."""
-    lat, lon = lat_lon_from_observer(observer)
-    tc = get_TimeCalc(lat, lon, t)
-    return tc.getLocalTime()
+    def build():
+        lat, lon = lat_lon_from_observer(observer)
+        # Hold the lock across both calls so another thread can't retarget
+        # the shared TimeCalc between the lookup and the conversion.
+        with _time_calc_lock:
+            tc = get_TimeCalc(lat, lon, t)
+            return tc.getLocalTime()
+    return _boundary_memo('local', t, observer, build)
 
 
 def moon_phase(t=None):
-    """Return the phase of the moon  at time `t`. 0 = New, 25 = Fisrt Quarter, 50 = Full, etc."""
+    """Return the phase of the moon  at time `t`. 0 = New, 25 = Fisrt Quarter, 50 = Full, etc.
+       t may be a vector Time, in which case an array of phases is returned."""
+    _load()
     if t is None: t = now()
-    t._nutation_angles = iau2000b(t.tt)
+    _ensure_nutation(t)
     e = earth.at(t)
     _, mlon, _ = e.observe(moon).apparent().ecliptic_latlon('date')
     _, slon, _ = e.observe(sun).apparent().ecliptic_latlon('date')
     # phase = ((mlon.radians - slon.radians) // (tau / 8) % 8).astype(int)
     phase = ((mlon.radians - slon.radians) / (tau / 100) % 100)
+    if np.ndim(phase):
+        return np.round(phase, ROUNDING)
     return round(phase, ROUNDING)
 
 
@@ -234,17 +419,23 @@ def moon_phase(t=None):
 #
 # If t is a skyfield Time object, use that for calcuation. If t is None, use now()/
 #
-def info(target, observer, pos_only=False, t=None):
+# obs may be passed as observer.at(t) computed by the caller; loops over many
+# bodies (print_planets, whats_up) share one so the barycentric position of
+# the observer is computed once instead of per body.
+#
+def info(target, observer, pos_only=False, t=None, obs=None, grid=None):
+    _load()
     if t is None:    t = now()
+    if obs is None:  obs = observer.at(t)
     name           = name_from_body(target)
-    astrometric    = observer.at(t).observe(target)
+    astrometric    = obs.observe(target)
     apparent       = astrometric.apparent()
     const          = pos_to_constellation(apparent)
     alt, azm, dist = apparent.altaz('standard')
     alt            = round(alt.degrees, ROUNDING)
     azm            = round(azm.degrees, ROUNDING)
     dist           = round(dist.km * 0.6213712, ROUNDING)
-    if target in [moon, mercury, venus, mars]:
+    if id(target) in _ILLUM_IDS:
         illum = almanac.fraction_illuminated(planets, name, t)
         if math.isnan(illum):
             illum = 1.0
@@ -259,22 +450,26 @@ def info(target, observer, pos_only=False, t=None):
     else:
         rad = 0.0
     
-    ta, ya = almanac.find_discrete(
-                day_start(t, observer),
-                day_end(t, observer),
-                risings_and_settings(planets, target, observer, radius=rad))
-    culm_time, culm_alt = culmination(target, observer, t)
-    rise_time = set_time = None
-    for yi, ti in zip(ya, ta):
-        if yi:
-            rise_time = ti
-        else:
-            set_time = ti
+    t0 = day_start(t, observer)
+    t1 = day_end(t, observer)
+    if grid is None:
+        grid = _ensure_nutation(ts.tt_jd(np.linspace(t0.tt, t1.tt, 289)))
+    # One altitude sweep serves both the rise/set crossings and (for all
+    # bodies but the sun) the culmination peak.
+    curve = (grid.tt, observer.at(grid).observe(target).apparent().altaz()[0].degrees)
+    rise_time, set_time = rise_and_set(target, observer, t0, t1, radius=rad, curve=curve)
+    culm_time, culm_alt = culmination(target, observer, t, t0, t1, curve=curve)
     rise_time = None if rise_time is None else time_to_local_datetime(rise_time, observer)
     set_time  = None if set_time  is None else time_to_local_datetime(set_time, observer)
     return name, alt, azm, dist, rise_time, culm_time, set_time, culm_alt, illum, const
 
 
+# Format an optional datetime as HH:MM:SS; None (a body that never rises,
+# sets or culminates) becomes an empty column.
+def _hms(dt):
+    return '' if dt is None else dt.strftime('%H:%M:%S')
+
+
 # Given an observer body or Topo (example: home_pos), print an ephemeris to stdout.
 # If pos_only, then just alt, azm and distance are printed.
 # If not pos_only (the default) all info from astro.info is included.
@@ -282,44 +477,64 @@ def info(target, observer, pos_only=False, t=None):
 # If t is a skyfield Time object, use that for calcuation. If t is None, use now()
 #
 def print_planets(observer, pos_only=False, t=None):
+    _load()
     if t is None:
         t = now()
+    # The page is accumulated in lines and emitted with a single write at
+    # the end; thirteen line-buffered prints are thirteen syscalls when
+    # stdout is a pipe (the journal, under systemd).
+    lines = []
     def print_title(pos_only):
+        # One conversion serves the date and the time; converting twice also
+        # risked a mismatched pair if t sat on a timezone boundary.
         dt = time_to_local_datetime(t, observer)
-        print('%s for %s from latitude %.4f, longitude %.4f at %s local time.' % (
+        lines.append('%s for %s from latitude %.4f, longitude %.4f at %s local time.' % (
             'Fast data' if pos_only else 'Data',
-            time_to_local_datetime(t, observer).date(),
+            dt.date(),
             home_topo.latitude.degrees,
             home_topo.longitude.degrees,
             dt.strftime('%H:%M:%S')))
     def print_header(pos_only):
         if pos_only:
-            print('Body       Alt     Azm      Distance')
-            print('-------  ------  ------  -------------')
+            lines.append('Body       Alt     Azm      Distance')
+            lines.append('-------  ------  ------  -------------')
         else:
-            print('Body       Alt     Azm   Const   Rising    Culmin   Setting    CulAlt  Illum     Distance')
-            print('-------  ------  ------  -----  --------  --------  --------   ------  -----  -------------')
+            lines.append('Body       Alt     Azm   Const   Rising    Culmin   Setting    CulAlt  Illum     Distance')
+            lines.append('-------  ------  ------  -----  --------  --------  --------   ------  -----  -------------')
+    # Warm t's lazy Earth-orientation state (truncated nutation, sidereal
+    # time, rotation matrix) before the loop so no body pays for it alone.
+    _ensure_nutation(t)
+    t.M, t.MT, t.gast
+    grid = None
+    if not pos_only:
+        # Each body's rise/set search sweeps the same day; a CachedObserver
+        # plus one shared grid Time let all ten sweeps reuse the observer
+        # states and orientation matrices computed for the first body.
+        observer = CachedObserver(observer)
+        t0, t1   = day_start(t, observer), day_end(t, observer)
+        grid     = _ensure_nutation(ts.tt_jd(np.linspace(t0.tt, t1.tt, 289)))
+    obs = observer.at(t)  # Shared across all ten bodies below
     def print_body(body, pos_only):
         if pos_only:
-            name, alt, azm, dist, illum = info(body, observer, True, t)
-            print('{0:7s}  {1:6.2f}  {2:6.2f}  {3:13,}'.format(
+            name, alt, azm, dist, illum = info(body, observer, True, t, obs)
+            lines.append('{0:7s}  {1:6.2f}  {2:6.2f}  {3:13,}'.format(
                 name,
                 alt,
                 azm,
                 int(dist)
             ))
         else:
-            name, alt, azm, dist, rise_time, culm_time, set_time, culm_alt, illum, const = info(body, observer, False, t)
+            name, alt, azm, dist, rise_time, culm_time, set_time, culm_alt, illum, const = info(body, observer, False, t, obs, grid)
             if illum is None:
                 illum = 100.0
-            print('{0:7s}  {1:6.2f}  {2:6.2f}  {3:5s}  {4:8s}  {5:8s}  {6:8s}  {7:7.2f}  {8:5.1f}  {9:13,}'.format(
+            lines.append('{0:7s}  {1:6.2f}  {2:6.2f}  {3:5s}  {4:8s}  {5:8s}  {6:8s}  {7:7.2f}  {8:5.1f}  {9:13,}'.format(
                 name,
                 alt,
                 azm,
                 const,
-                '' if rise_time is None else rise_time.strftime('%H:%M:%S'),
-                '' if culm_time is None else culm_time.strftime('%H:%M:%S'),
-                '' if set_time  is None else set_time.strftime('%H:%M:%S'),
+                _hms(rise_time),
+                _hms(culm_time),
+                _hms(set_time),
                 0.0 if culm_alt is  None else culm_alt,
                 illum,
                 int(dist)
@@ -328,81 +543,126 @@ def print_planets(observer, pos_only=False, t=None):
     print_header(pos_only)
     for body in [sun, moon, mercury, venus, mars, jupiter, saturn, uranus, neptune, pluto]:
         print_body(body, pos_only)
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 
 # Make a sorted list of objects that are above the horizon at a given time and location.
 # Return a JSON string describing each visible body.
 def whats_up(observer, t=None):
+    _load()
     if t is None:
         t   = now()
-    visible = {}
+    # The schema is fixed (four numeric fields per body, names from our own
+    # tables), so the JSON is assembled directly rather than routed through
+    # json.dumps and its per-value type dispatch.
+    parts = []
+    obs   = observer.at(t)  # Shared across the body loop
     for body in [sun, moon, mercury, venus, mars, jupiter, saturn]:
-        name, alt, azm, dist, illum = info(body, observer, True, t)
+        name, alt, azm, dist, illum = info(body, observer, True, t, obs)
         illum = 100.0 if illum is None else round(illum, 2)
         if alt > 0:
-            visible[name] = {'alt': alt, 'azm': azm, 'dist': dist, 'illum': illum}
-    return json.dumps(visible)
+            parts.append('"{0}": {{"alt": {1}, "azm": {2}, "dist": {3}, "illum": {4}}}'.format(
+                name, alt, azm, dist, illum))
+    return '{' + ', '.join(parts) + '}'
 
 
 def now():
+    _load()
     return ts.now()
 
 
+# Build a Time from an aware datetime by passing ts.utc plain components.
+# The datetime overload of ts.utc goes through a generic conversion path;
+# normalizing to UTC here and unpacking the fields skips it.
+def _ts_from_dt(dt):
+    _load()
+    dt = dt.astimezone(timezone.utc)
+    return ts.utc(dt.year, dt.month, dt.day, dt.hour, dt.minute,
+                  dt.second + dt.microsecond * 1e-6)
+
+
 def year_start(t, observer):
-    dt = time_to_local_datetime(t, observer)
-    dt = dt.replace(month=1, day=1, hour=0, minute=0, second=0, microsecond=0)
-    return ts.utc(dt)
+    def build():
+        dt = time_to_local_datetime(t, observer)
+        dt = dt.replace(month=1, day=1, hour=0, minute=0, second=0, microsecond=0)
+        return _ts_from_dt(dt)
+    return _boundary_memo('year0', t, observer, build)
 
 
 def year_end(t, observer):
-    dt = time_to_local_datetime(t, observer)
-    dt = dt.replace(month=12, day=31, hour=23, minute=59, second=59, microsecond=999999)
-    return ts.utc(dt)
+    def build():
+        dt = time_to_local_datetime(t, observer)
+        dt = dt.replace(month=12, day=31, hour=23, minute=59, second=59, microsecond=999999)
+        return _ts_from_dt(dt)
+    return _boundary_memo('year1', t, observer, build)
 
 
 def month_start(t, observer):
-    dt = time_to_local_datetime(t, observer)
-    dt = dt.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-    return ts.utc(dt)
+    def build():
+        dt = time_to_local_datetime(t, observer)
+        dt = dt.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        return _ts_from_dt(dt)
+    return _boundary_memo('month0', t, observer, build)
 
 
 def month_end(t, observer):
-    dt = time_to_local_datetime(t, observer)
-    md = [31, 28, 31, 30, 31, 31, 30, 31, 30, 31, 30, 31]
-    if calendar.isleap(dt.year): md[1] += 1
-    ld = md[dt.month]
-    dt = dt.replace(day=ld, hour=23, minute=59, second=59, microsecond=999999)
-    return ts.utc(dt)
+    def build():
+        dt = time_to_local_datetime(t, observer)
+        ld = _MONTH_DAYS[dt.month - 1]
+        if 2 == dt.month and calendar.isleap(dt.year): ld = 29
+        dt = dt.replace(day=ld, hour=23, minute=59, second=59, microsecond=999999)
+        return _ts_from_dt(dt)
+    return _boundary_memo('month1', t, observer, build)
 
 
 def day_start(t, observer):
-    dt = time_to_local_datetime(t, observer)
-    dt = dt.replace(hour=0, minute=0, second=0, microsecond=0)
-    return ts.utc(dt)
+    def build():
+        dt = time_to_local_datetime(t, observer)
+        dt = dt.replace(hour=0, minute=0, second=0, microsecond=0)
+        return _ts_from_dt(dt)
+    return _boundary_memo('day0', t, observer, build)
 
 def day_noon(t, observer):
-    dt = time_to_local_datetime(t, observer)
-    dt = dt.replace(hour=12, minute=0, second=0, microsecond=0)
-    return ts.utc(dt)
+    def build():
+        dt = time_to_local_datetime(t, observer)
+        dt = dt.replace(hour=12, minute=0, second=0, microsecond=0)
+        return _ts_from_dt(dt)
+    return _boundary_memo('day12', t, observer, build)
 
 
 def day_end(t, observer):
-    dt = time_to_local_datetime(t, observer)
-    dt = dt.replace(hour=23, minute=59, second=59, microsecond=999999)
-    return ts.utc(dt)
+    def build():
+        dt = time_to_local_datetime(t, observer)
+        dt = dt.replace(hour=23, minute=59, second=59, microsecond=999999)
+        return _ts_from_dt(dt)
+    return _boundary_memo('day1', t, observer, build)
 
 
 def format_dt(dt):
     return dt.strftime('%m/%d/%Y %H:%M:%S')
 
 
-def topo_from_data(lat, lon, alt):
+# A stationary receiver reports the same fix over and over, and every
+# request used to build a fresh Topos and VectorSum from it. Memoize both
+# on coordinates rounded below GPS resolution (~10 cm horizontal, 10 cm
+# vertical); DayCalc keeps an equivalent cache of its own observers.
+@functools.lru_cache(maxsize=64)
+def _topo_cached(lat, lon, alt):
     return api.Topos(lat, lon, elevation_m=alt)
 
 
+@functools.lru_cache(maxsize=64)
+def _loc_cached(lat, lon, alt):
+    _load()
+    return earth + _topo_cached(lat, lon, alt)
+
+
+def topo_from_data(lat, lon, alt):
+    return _topo_cached(round(lat, 6), round(lon, 6), round(alt, 1))
+
+
 def loc_from_data(lat, lon, alt):
-    topo = topo_from_data(lat, lon, alt)
-    return earth + topo
+    return _loc_cached(round(lat, 6), round(lon, 6), round(alt, 1))
 
 
 if '__main__' == __name__:
@@ -420,26 +680,66 @@ else:
     loader = api.Loader(data_dir, expire=False, verbose=False)
 
 
-try:
-    ts    = loader.timescale()
-except:
-    logging.warning('Error loading timescale. Falling back on builtin timescale.')
-    ts    = loader.timescale(builtin=True)
-planets   = loader('de421.bsp')
-sun       = planets['sun']
-moon      = planets['moon']
-mercury   = planets['mercury']
-venus     = planets['venus']
-earth     = planets['earth']
-mars      = planets['mars']
-jupiter   = planets['jupiter barycenter']
-saturn    = planets['saturn barycenter']
-uranus    = planets['uranus barycenter']
-neptune   = planets['neptune barycenter']
-pluto     = planets['pluto barycenter']
 home_topo = api.Topos('47.725476 N', '122.1802654 W', elevation_m=95)
-home_loc  = earth + home_topo
+_loaded   = False
+
+
+# Parsing the timescale and de421.bsp dominates this module's import time
+# on the Pi Zero, and some importers (the socket server's helpers, the
+# haversine/Topos utilities) never touch the ephemeris. Defer the heavy
+# loading until a body, ts, or planets is actually needed; every function
+# above that uses them calls _load() first, and external attribute access
+# goes through the module __getattr__ below (PEP 562).
+def _load():
+    global _loaded, ts, planets, sun, moon, mercury, venus, earth, mars
+    global jupiter, saturn, uranus, neptune, pluto, home_loc
+    global _BODY_FROM_NAME, _NAME_FROM_ID, _ILLUM_IDS
+    if _loaded:
+        return
+    _loaded = True
+    try:
+        ts    = loader.timescale()
+    except:
+        logging.warning('Error loading timescale. Falling back on builtin timescale.')
+        ts    = loader.timescale(builtin=True)
+    planets   = loader('de421.bsp')
+    sun       = planets['sun']
+    moon      = planets['moon']
+    mercury   = planets['mercury']
+    venus     = planets['venus']
+    earth     = planets['earth']
+    mars      = planets['mars']
+    jupiter   = planets['jupiter barycenter']
+    saturn    = planets['saturn barycenter']
+    uranus    = planets['uranus barycenter']
+    neptune   = planets['neptune barycenter']
+    pluto     = planets['pluto barycenter']
+    home_loc  = earth + home_topo
+
+    # Lookup tables for name_from_body/body_from_name, above.
+    _BODY_FROM_NAME = {
+        'sun':     sun,     'moon':    moon,    'mercury': mercury,
+        'venus':   venus,   'earth':   earth,   'mars':    mars,
+        'jupiter': jupiter, 'saturn':  saturn,  'uranus':  uranus,
+        'neptune': neptune, 'pluto':   pluto
+    }
+    _NAME_FROM_ID = {id(body): name.capitalize() for name, body in _BODY_FROM_NAME.items()}
+    _ILLUM_IDS    = frozenset(map(id, (moon, mercury, venus, mars)))  # Bodies info() reports illumination for
+
+
+_LAZY = frozenset((
+    'ts', 'planets', 'sun', 'moon', 'mercury', 'venus', 'earth', 'mars',
+    'jupiter', 'saturn', 'uranus', 'neptune', 'pluto', 'home_loc',
+    '_BODY_FROM_NAME', '_NAME_FROM_ID', '_ILLUM_IDS'))
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        _load()
+        return globals()[name]
+    raise AttributeError('module {0!r} has no attribute {1!r}'.format(__name__, name))
 
 
 if '__main__' == __name__:
+    _load()
     print_planets(home_loc)
@@ -1,3 +1,14 @@
+import numpy as np
+
+# Hoisted out of direction_from_angle: the names never change, and
+# rebuilding the list plus the segment size on every call made the hot
+# path mostly allocation.
+direction_names = ('N', 'NNE', 'NE', 'ENE', 'E', 'ESE', 'SE', 'SSE',
+                   'S', 'SSW', 'SW', 'WSW', 'W', 'WNW', 'NW', 'NNW')
+nsegs           = len(direction_names)
+seg_size        = 360 / nsegs
+
+
 def direction_from_angle(ang):
     """ Convert an angle, like 33.12, to a direction, like 'NNE'
         Large numbers are folded to 0-360, and negative angles
@@ -14,15 +25,22 @@ def direction_from_angle(ang):
         SE    123.75    135     146.25    NW      303.75    315     326.25
         SSE  >146.25    157.5  <168.75    NNW    >326.25    337.5  <348.75
     """
-    direction_names = ['N', 'NNE', 'NE', 'ENE', 'E', 'ESE', 'SE', 'SSE',
-                       'S', 'SSW', 'SW', 'WSW', 'W', 'WNW', 'NW', 'NNW']
-    nsegs    = len(direction_names)
-    seg_size = 360 / nsegs
-    ang      = abs(ang % 360)
-    assert(0 <= ang <= 360), 'ang = {0},'.format(ang)
-    seg      = round(ang / seg_size) % nsegs
-    assert(0 <= seg < nsegs)
-    return   direction_names[seg]
+    # % 360 already yields a non-negative result for negative angles, and
+    # with 16 segments the final wrap is a bitmask instead of a modulo
+    return direction_names[round((ang % 360) / seg_size) & (nsegs - 1)]
+
+
+_direction_names_np = np.array(direction_names)
+
+
+def direction_from_angles(angs):
+    """ Vectorized direction_from_angle for a whole array of bearings.
+        Same folding and boundary behavior (np.rint rounds half to even,
+        like round), one C loop instead of a Python call per angle.
+    """
+    angs = np.asarray(angs)
+    segs = np.rint((angs % 360) / seg_size).astype(np.intp) & (nsegs - 1)
+    return _direction_names_np[segs]
 
 
 def test():
@@ -127,4 +145,5 @@ def test():
     assert(nnw1 == 'NNW' and nnw2 == 'NNW' and nnw3 == 'NNW')
 
 
-test()
+if '__main__' == __name__:
+    test()
@@ -21,7 +21,7 @@
 
 # Load the settings dictionary and access settings as: cfg.get['KEY']
 import configuration as cfg
-import time, signal, threading, json, datetime, os, socket, sys, math, logging, astro, DayCalc, traceback, geomag
+import time, signal, threading, functools, json, datetime, os, select, socket, sys, math, logging, astro, DayCalc, traceback, geomag
 
 logging.basicConfig(format='%(levelname)s:%(message)s', level=cfg.locationd['LOGGING_LEVEL'])
 logging.info('Configuration file loaded. Logging level: %s', cfg.locationd['LOGGING_LEVEL'])
@@ -76,22 +76,36 @@ class GpsPoller(threading.Thread):
         return self.current_value
 
     def run(self):
-        while self.watching and not self._stopevent.isSet():
+        while self.watching and not self._stopevent.is_set():
             try:
+                # Wait on the gpsd socket instead of sleeping a fixed 200 ms:
+                # the thread wakes exactly when a record arrives, state is
+                # fresh the moment a client asks, and there are no no-op
+                # wakeups in between. The timeout keeps shutdown responsive.
+                readable, _, _ = select.select([self.session.sock], [], [], 1.0)
+                if not readable:
+                    continue
                 report = self.session.next()
                 if report['class'] == 'TPV':
-                    self.current_value = self.session.next()
+                    # Store the report just classified; reading the stream
+                    # again here returned the *next* record (usually not a
+                    # TPV at all) and doubled the gpsd round trips.
+                    self.current_value = report
                     # TODO: we should check regularly, once an hour or so (configurable)
                     if not self.system_time_has_been_set:
                         self.check_set_system_time(report)
             except:
                 logging.error('Error reading gpsd data.')
-            time.sleep(0.2) # tune this, you might not get values that quickly
+                # Back off without spinning, but wake instantly on shutdown
+                if self._stopevent.wait(0.2):
+                    break
 
     def check_set_system_time(self, report):
         if report['mode'] >= 2:
             self.system_time_has_been_set = True
-            rep_time  = datetime.datetime.strptime(report['time'], '%Y-%m-%dT%H:%M:%S.%f%z')
+            # fromisoformat is a C fast path; strptime re-walks its format
+            # string per call. Older Pythons don't take the trailing 'Z'.
+            rep_time  = datetime.datetime.fromisoformat(report['time'].replace('Z', '+00:00'))
             sys_time  = datetime.datetime.now(datetime.timezone.utc)
             time_diff = abs((sys_time - rep_time).total_seconds())
             if time_diff > MAX_TIME_DIFFERENCE:
@@ -99,16 +113,20 @@ class GpsPoller(threading.Thread):
                 logging.info('GSP time = %s', rep_time)
                 logging.info('System time differes from GPS time by %s seconds. Updating.', int(time_diff))
                 try:
-                    os.system('date -s ' + report['time'])
+                    # One syscall. Shelling out to 'date -s' forked /bin/sh
+                    # and /bin/date, stalling the poller thread for hundreds
+                    # of milliseconds on the Pi Zero.
+                    time.clock_settime(time.CLOCK_REALTIME, rep_time.timestamp())
                 except:
                     logging.error('Failed to set system time.')
 
     def join(self, timeout=None):
+        # The poller checks the event between selects, so no grace sleep is
+        # needed; it falls out of its loop within one select timeout.
         self._stopevent.set()
-        time.sleep(0.5) # Time for current operation to end
+        threading.Thread.join(self, timeout)
         if self.session is not None:
             self.session.close()
-        threading.Thread.join(self, timeout)
 
 
 ################################################################################
@@ -135,9 +153,15 @@ def persist_state():
     global state
 
     state['persistance_version'] = PERSISTENCE_VER
-    cache = open(CACHE_FILE_NAME, 'w')
-    cache.write(json.dumps(state, sort_keys=False, indent=4, separators=(',', ': ')))
+    # Write compact JSON to a temp file and rename it into place: the
+    # rename is atomic, so a crash mid-write can't leave a truncated cache
+    # for load_state to choke on, and the compact form writes ~3x fewer
+    # bytes to the SD card.
+    tmp   = CACHE_FILE_NAME + '.tmp'
+    cache = open(tmp, 'w')
+    cache.write(json.dumps(state, separators=(',', ':')))
     cache.close()
+    os.replace(tmp, CACHE_FILE_NAME)
     del state['persistance_version']
 
 
@@ -170,24 +194,40 @@ def shutdown():
     exit(0)
 
 
+# Bumped by update_state whenever a field actually changes; consumers that
+# cache derived values (the encoded gps reply) compare against it instead
+# of recomputing per request.
+state_version = 0
+
+
 # Update the global 'state' dictionary from the GpsPoller
 def update_state():
-    global state
+    global state, state_version
     report = gpsp.value()
+    # gps.dictwrapper keeps the TPV fields as its __dict__; grabbing that
+    # once turns six attribute-protocol traversals into C-level dict gets.
+    # Before the first fix current_value is a plain dict, used as-is.
+    r = report if isinstance(report, dict) else getattr(report, '__dict__', {})
 
     # if mode is zero or 1, there is no fix. Do not replace -1 (from cache) unless there is a fix
-    val = getattr(report,'mode',0)
+    val  = r.get('mode', 0)
+    mode = state['mode']
     if state['mode'] == -1:
-        if 'n/a' != val and int(val) > 1: state['mode'] = int(val)
+        if 'n/a' != val and int(val) > 1: mode = int(val)
     else:
-        if 'n/a' != val: state['mode'] = int(val)
+        if 'n/a' != val: mode = int(val)
 
-    state['time']  = getattr(report,'time',state['time'])
-    state['lat']   = getattr(report,'lat',state['lat'])
-    state['lon']   = getattr(report,'lon',state['lon'])
-    state['alt']   = getattr(report,'alt',state['alt'])
-    state['speed'] = getattr(report,'speed',state['speed'])
-    state['climb'] = getattr(report,'climb',state['climb'])
+    updates = (('mode',  mode),
+               ('time',  r.get('time',  state['time'])),
+               ('lat',   r.get('lat',   state['lat'])),
+               ('lon',   r.get('lon',   state['lon'])),
+               ('alt',   r.get('alt',   state['alt'])),
+               ('speed', r.get('speed', state['speed'])),
+               ('climb', r.get('climb', state['climb'])))
+    for key, value in updates:
+        if state[key] != value:
+            state[key]    = value
+            state_version += 1
 
 
 ################################################################################
@@ -210,15 +250,25 @@ def get_mag_decl():
     return geomag.declination(dlat=state['lat'], dlon=state['lon'],h=state['alt'])
 
 
+_gps_reply   = None  # Encoded reply for the gps selector, valid for _gps_version
+_gps_version = -1
+
+
 # Return a JSON string representing the current state:
 def get_json():
+    global _gps_reply, _gps_version
     update_state()
-    # Add magnetic declination to state values before transmitting
-    state_prime = state.copy()
-    magdec = get_mag_decl()
-    magdec = round(magdec,  ALMANAC_ROUNDING)
-    state_prime['magdec'] = str(magdec)
-    return json.dumps(state_prime)
+    # Dashboards poll faster than the GPS updates; re-encode only when a
+    # state field actually changed since the last reply was built.
+    if _gps_version != state_version:
+        # Add magnetic declination to state values before transmitting
+        state_prime = state.copy()
+        magdec = geomag.declination(dlat=state['lat'], dlon=state['lon'], h=state['alt'])
+        magdec = round(magdec,  ALMANAC_ROUNDING)
+        state_prime['magdec'] = str(magdec)
+        _gps_reply   = json.dumps(state_prime, separators=(',', ':'))
+        _gps_version = state_version
+    return _gps_reply
 
 
 # Return a nested JSON string describing all the naked-eye visible bodies
@@ -253,30 +303,60 @@ def get_sidereal_string():
     t      = datetime.time(h, m, s)
     return str(t)
 
+# Identical instants and fixes produce identical replies, so the expensive
+# selectors are cached on quantized (time, location) keys: repeated polls
+# inside the window are dict probes. Quantization windows are matched to how
+# fast each answer actually changes (time: 1 s, almanac: 1 min, day: the day).
+_reply_cache = {}
+
+
+def _cached_reply(key, build):
+    reply = _reply_cache.get(key)
+    if reply is None:
+        if 64 <= len(_reply_cache):
+            _reply_cache.clear()
+        reply = _reply_cache[key] = build()
+    return reply
+
+
+def _loc_key():
+    return round(state['lat'], 4), round(state['lon'], 4), round(state['alt'])
+
+
 # Generate the shape-of-day info dictionary, convert to JSON and return.
 # Note: this is extremely expensive on the RPiZero.
 def get_day_info():
     update_state()
-    di = DayCalc.DayCalc(state['lat'], state['lon'], state['alt'])
-    return di.as_json()
+    def build():
+        di = DayCalc.DayCalc(state['lat'], state['lon'], state['alt'])
+        return di.as_json()
+    return _cached_reply(('day', datetime.date.today()) + _loc_key(), build)
 
 
 # Return JSON representing TimeCalc info
+# Fixed-shape HH:MM:SS; three integer formats beat strftime's format-string
+# walk and locale lookups for every time reply.
+def _hms(dt):
+    return '{0:02d}:{1:02d}:{2:02d}'.format(dt.hour, dt.minute, dt.second)
+
+
 def get_time_info():
     update_state()
-    result             = {}
-    tcalc              = astro.get_TimeCalc(state['lat'], state['lon'])
-    result['utc']      = tcalc.getUtcTime().strftime('%H:%M:%S')
-    result['local']    = tcalc.getLocalTime().strftime('%H:%M:%S')
-    result['solar']    = tcalc.getSolarTime().strftime('%H:%M:%S')
-    result['timezone'] = tcalc.getTimeZoneName()
-    result['jdate']    = tcalc.getJDate()
-    result['gmst']     = tcalc.decimalHoursToHMS(tcalc.getGMST())
-    result['lmst']     = tcalc.decimalHoursToHMS(tcalc.getLMST())
-    result['doy']      = tcalc.getDOY(tcalc.getLocalTime())
-    strResult          = json.dumps(result)
-    logging.debug('Result: %s', strResult)
-    return strResult
+    def build():
+        result             = {}
+        tcalc              = astro.get_TimeCalc(state['lat'], state['lon'])
+        result['utc']      = _hms(tcalc.getUtcTime())
+        result['local']    = _hms(tcalc.getLocalTime())
+        result['solar']    = _hms(tcalc.getSolarTime())
+        result['timezone'] = tcalc.getTimeZoneName()
+        result['jdate']    = tcalc.getJDate()
+        result['gmst']     = tcalc.decimalHoursToHMS(tcalc.getGMST())
+        result['lmst']     = tcalc.decimalHoursToHMS(tcalc.getLMST())
+        result['doy']      = tcalc.getDOY(tcalc.getLocalTime())
+        strResult          = json.dumps(result, separators=(',', ':'))
+        logging.debug('Result: %s', strResult)
+        return strResult
+    return _cached_reply(('time', int(time.time())) + _loc_key(), build)
 
 
 # Return an almanac json blob for the body requested
@@ -287,32 +367,51 @@ def get_almanac(body_name):
     if target is None:
         return'{"error": "name"}'
     update_state()
-    obsv   = astro.loc_from_data(state['lat'], state['lon'], state['alt'])
-    # Use default system time; locationd has done its best to set it correctly
-    name, alt, azm, dist, illum = astro.info(target, obsv, True)
-    
-    result['name'] = name
-    result['alt']  = round(alt,  ALMANAC_ROUNDING)
-    result['azm']  = round(azm,  ALMANAC_ROUNDING)
-    result['dist'] = round(dist, ALMANAC_ROUNDING)
-    if illum is not None:
-        result['illum'] = round(illum, ALMANAC_ROUNDING)
-    if 'moon' == body_name:
-        result['phase'] = astro.moon_phase()
-    strResult = json.dumps(result)
-    logging.debug('Result: %s', strResult)
-    return strResult
+    def build():
+        obsv   = astro.loc_from_data(state['lat'], state['lon'], state['alt'])
+        # Use default system time; locationd has done its best to set it correctly
+        name, alt, azm, dist, illum = astro.info(target, obsv, True)
+
+        result['name'] = name
+        result['alt']  = round(alt,  ALMANAC_ROUNDING)
+        result['azm']  = round(azm,  ALMANAC_ROUNDING)
+        result['dist'] = round(dist, ALMANAC_ROUNDING)
+        if illum is not None:
+            result['illum'] = round(illum, ALMANAC_ROUNDING)
+        if 'moon' == body_name:
+            result['phase'] = astro.moon_phase()
+        strResult = json.dumps(result, separators=(',', ':'))
+        logging.debug('Result: %s', strResult)
+        return strResult
+    # Positions drift on the scale of minutes at the rounding transmitted
+    return _cached_reply(('almanac', body_name, int(time.time() // 60)) + _loc_key(), build)
+
+
+# Selector -> handler table; one dict probe replaces the if/elif chain and
+# the linear scan over the body-name list on every connection.
+_HANDLERS = {
+    'gps':       get_json,
+    'localtime': get_localtime_string,
+    'sidereal':  get_sidereal_string,
+    'time':      get_time_info,
+    'day':       get_day_info,
+    'whatsup':   get_whatsup,
+}
+for _body in ['sun', 'moon', 'mercury', 'venus', 'mars', 'jupiter', 'saturn', 'uranus', 'neptune', 'pluto']:
+    _HANDLERS[_body] = functools.partial(get_almanac, _body)
 
 
 # Never return: wait for socket connections
 def socket_server():
     logging.info('Starting socket server.')
     sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    # Allow immediate rebinding after a restart instead of waiting out TIME_WAIT
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
     logging.debug('socket created.')
     #Bind socket to local host and port
     try:
         sock.bind((SOCKET_HOST, SOCKET_PORT))
-        logging.info('Socket bound to port %s on host %s.' % (SOCKET_PORT, SOCKET_HOST))
+        logging.info('Socket bound to port %s on host %s.', SOCKET_PORT, SOCKET_HOST)
     except socket.error as msg:
         logging.critical('Socket bind failed.')
         sys.exit()
@@ -321,32 +420,23 @@ def socket_server():
         logging.warning(e)
         logging.warning('Continuing...')
     #Start listening on socket
-    sock.listen(10)
+    sock.listen(128)
     logging.info('Socket now listening')
 
     #now keep talking with the client
     while True:
         #wait to accept a connection - blocking call
         conn, addr = sock.accept()
+        # The replies are single small packets; don't let Nagle hold them
+        conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
         data = conn.recv(16)
         msg = data.decode()
-        logging.info("Server received: '%s' from %s:%s" % (msg, addr[0], str(addr[1])))
-        if 'gps' == msg:
-            reply = get_json()
-        elif 'localtime' == msg:
-            reply = get_localtime_string()
-        elif 'sidereal' == msg:
-            reply = get_sidereal_string()
-        elif 'time' == msg:
-            reply = get_time_info()
-        elif 'day' == msg:
-            reply = get_day_info()
-        elif msg in ['sun', 'moon', 'mercury', 'venus', 'mars', 'jupiter', 'saturn', 'uranus', 'neptune', 'pluto']:
-            reply = get_almanac(msg)
-        elif 'whatsup' == msg:
-            reply = get_whatsup()
+        logging.info("Server received: '%s' from %s:%s", msg, addr[0], addr[1])
+        handler = _HANDLERS.get(msg)
+        if handler is not None:
+            reply = handler()
         else:
-            logging.warning('Unexpected selector in socket msg: %s' % (msg))
+            logging.warning('Unexpected selector in socket msg: %s', msg)
             reply = '{"error":"' + msg + '"}'
         conn.sendall(reply.encode())
         conn.close()
@@ -3,7 +3,8 @@
 import sys
 sys.path.append('../')
 import astro as a
-from datetime import datetime, timedelta
+import numpy as np
+from datetime import datetime
 from pytz import timezone
 
 year    = 2019
@@ -14,7 +15,12 @@ pacific = timezone('America/Los_Angeles')
 
 t = pacific.localize(datetime(year, month, day, 12, 0, 0))
 
+# One vector Time for the whole year instead of a datetime addition and a
+# scalar ts.utc conversion per day; pytz arithmetic would carry the January
+# offset all year anyway, so local noon is one fixed UTC hour.
+utc_hour = 12 + int(-t.utcoffset().total_seconds()) // 3600
+T = a.ts.utc(year, month, day + np.arange(365), utc_hour)
+
 for day in range(365):
-    a.print_planets(a.home_loc, False, a.ts.utc(t))
+    a.print_planets(a.home_loc, False, T[day])
     print()
-    t = t + timedelta(days=1)
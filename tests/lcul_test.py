@@ -4,6 +4,7 @@ import sys
 sys.path.append('../')
 import astro as a
 import DayCalc
+import numpy as np
 from datetime import datetime, timedelta
 from pytz import timezone
 
@@ -16,8 +17,14 @@ pacific = timezone('America/Los_Angeles')
 t = pacific.localize(datetime(year, month, day))
 tester = DayCalc.DayCalc(a.home_topo.latitude.degrees, a.home_topo.longitude.degrees, a.home_topo.elevation.m, t)
 
+# One vector Time for the whole year instead of a scalar ts.utc conversion
+# per iteration. The pytz arithmetic below carries the January UTC offset
+# all year, so local midnight is a fixed UTC hour for every day.
+utc_hour = int(-t.utcoffset().total_seconds()) // 3600
+T = a.ts.utc(year, month, day + np.arange(365), utc_hour)
+
 for day in range(365):
-    a_t = a.ts.utc(t)
+    a_t = T[day]
     tt, alt = a.culmination(a.moon, tester.loc, a_t)
     #assert tt is not None
     print(tt, alt)
@@ -1,8 +1,9 @@
 #!/usr/bin/env python3
 
-import sys, random
+import sys
 sys.path.append('../')
 import astro as a
+import numpy as np
 from TimeCalc import TimeCalc
 
 tc = TimeCalc(89, 0)
@@ -10,10 +11,12 @@ for lon in range(-180, 181):
     tc.change_location(89, lon)
     print(lon, '\t', tc.getTimeZoneName(), '\t', tc.getLocalTime())
 
-# Check for exceptions with random locations
+# Check for exceptions with random locations.
+# Draw all the coordinates in two vectorized calls up front; the loop
+# then only indexes, instead of two scalar randoms plus scaling per pass.
+lats = np.random.uniform(-90.0, 90.0, 1000)
+lons = np.random.uniform(-180.0, 180.0, 1000)
 for x in range(1000):
-    lat = random.random() * 180.0 - 90.0
-    lon = random.random() * 360.0 - 180.0
-    tc.change_location(lat, lon)
+    tc.change_location(lats[x], lons[x])
     t = tc.getTimeZoneName()
-    print(lat, '\t', lon, '\t', t)
+    print(lats[x], '\t', lons[x], '\t', t)
@@ -3,6 +3,7 @@
 import sys
 sys.path.append('../')
 import astro as a
+import numpy as np
 from datetime import datetime, timedelta
 from pytz import timezone
 
@@ -14,7 +15,14 @@ pacific = timezone('America/Los_Angeles')
 
 t = pacific.localize(datetime(year, month, day, 12, 0, 0))
 
+# One vector Time and one vectorized moon_phase call cover the year; the
+# loop below only prints. pytz arithmetic carries the January offset all
+# year, so local noon is one fixed UTC hour, and t is kept just for the
+# printed label.
+utc_hour = 12 + int(-t.utcoffset().total_seconds()) // 3600
+T = a.ts.utc(year, month, day + np.arange(365), utc_hour)
+phases = a.moon_phase(T)
+
 for day in range(365):
-    phase = a.moon_phase(a.ts.utc(t))
-    print(str(t), phase)
+    print(str(t), phases[day])
     t = t + timedelta(days=1)
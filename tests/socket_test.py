@@ -7,6 +7,9 @@ PORT = 9999         # The port used by the server
 
 def testmsg(msg):
     with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        # locationd serves one selector per connection, so each message
+        # needs its own socket; at least send it without Nagle delay
+        s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
         s.connect((HOST, PORT))
         s.sendall(msg.encode())
         data = s.recv(1024)
@@ -4,29 +4,19 @@
 # Next, calculate the angular separations between each planet.
 # Print an 10x10 grid of angular separations in decimal degrees.
 #
-# The data is calculated in this shape:
-# 
-# Pos | Separation angles
-# --- | --------------------------------------------
-# Su  | ->P  ->N  ->U  ->Sa ->J  ->Ma ->V  ->Me ->Mo
-# Mo  | ->P  ->N  ->U  ->Sa ->J  ->Ma ->V  ->Me
-# Me  | ->P  ->N  ->U  ->Sa ->J  ->Ma ->V
-# V   | ->P  ->N  ->U  ->Sa ->J  ->Ma
-# Ma  | ->P  ->N  ->U  ->Sa ->J
-# J   | ->P  ->N  ->U  ->Sa
-# Sa  | ->P  ->N  ->U
-# U   | ->P  ->N
-# N   | ->P
-# P   |
-#
-# A function sep(body, body) will return the separation of any two body using the
-# ragged array of calculations, and a 10x10 array of separation angles as floats
-# will be created.
-# The function render(10x10arry) will print the table to stdout.
+# All ten positions are observed from a single earth.at(t), their unit
+# vectors stacked into a (10, 3) matrix, and the full 10x10 separation
+# matrix computed at once as arccos(U @ U.T). One matrix product and one
+# arccos replace the 45 scalar separation_from calls of the old ragged
+# per-row layout, and earth's barycentric position is solved once per
+# timestep instead of once per pair.
+# get_separation(p1, p2) reads any pair from the dense matrix, and
+# find_conjunctions scans its upper triangle.
 
 import sys
 sys.path.append('../')
 import astro as a
+import numpy as np
 
 MAX_SEP      = 0.5    # Maximum separation for a conjuntion in degrees (float)
 PRINT_TABLES = False  # Print all calculations if True
@@ -44,116 +34,69 @@ pUranus      = 7
 pNeptune     = 8
 pPluto       = 9
 
-# Indexes into the separations arrays:
-sPluto       = 0
-sNeptune     = 1
-sUranus      = 2
-sSaturn      = 3
-sJupiter     = 4
-sMars        = 5
-sVenus       = 6
-sMercury     = 7
-sMoon        = 8
-sSun         = 9
+# Planet ephemerides and names by pXXXX index, built once; the lookup
+# functions were rebuilding these lists on every call.
+_PLANETS = (a.sun, a.moon, a.mercury, a.venus, a.mars, a.jupiter, a.saturn, a.uranus, a.neptune, a.pluto)
+_NAMES   = ('Sun', 'Moon', 'Mercury', 'Venus', 'Mars', 'Jupiter', 'Saturn', 'Uranus', 'Neptune', 'Pluto')
 
 
 def planetFromIndex(index):
     """Given a pXXXX index, return a planet ephemeris."""
-    planets = [a.sun, a.moon, a.mercury, a.venus, a.mars, a.jupiter, a.saturn, a.uranus, a.neptune, a.pluto]
-    return planets[index]
+    return _PLANETS[index]
 
 
 def nameFromIndex(index):
     """Given a pXXXX index, return a planet name."""
-    planets = ['Sun', 'Moon', 'Mercury', 'Venus', 'Mars', 'Jupiter', 'Saturn', 'Uranus', 'Neptune', 'Pluto']
-    return planets[index]
-
-
-class Separations:
-    """Create an array of N separation calculations, indexed by sXXXX indexes."""
-    def __init__(self, count):
-        self.data = [None] * count
-    def get(self, index):
-        return self.data[index]
-    def set(self, index, value):
-        self.data[index] = value
-
-
-class Calculations:
-    """ The Calculations class represents one row of calculations:
-        One Location object (the location of the planet) and 0 - 9
-        angular separations, arranged by 'sXXXX' index order.
-        All calculations are done at time t relative to earth.
-        Radius is a float repesenting radius of the object."""
-    def __init__(self, pIndex, sCount, radius, t):
-        self.body        = planetFromIndex(pIndex)
-        self.name        = nameFromIndex(pIndex)
-        self.sCount      = sCount
-        self.radius      = radius
-        self.t           = t
-        self.separations  = Separations(sCount)
-        self.location    = a.earth.at(t).observe(self.body)
-    def calc(self, cList):
-        for sIndex in range(sPluto, self.sCount):
-            target      = cList.calcs[pPluto-sIndex].body
-            astrometric = a.earth.at(self.t).observe(target)
-            sep         = self.location.separation_from(astrometric).degrees
-            sep         -= cList.calcs[pPluto-sIndex].radius
-            sep         -= self.radius
-            self.separations.set(sIndex, abs(sep))
-        # line = '{0:8s}'.format(self.name)
-        # radec = self.location.radec(a.ts.J2000)
-        # line += '{0:18s}'.format(str(radec[0]))
-        # line += '{0:18s}'.format(str(radec[1]))
-        # for i in range(0, self.sCount):
-        #     line += '{0:8.4f}, '.format(self.separations.get(i))
-        # print(line)
-    def find_conjunctions(self, min_sep):
-        """search for separations less than or equal to min_sep and return count and text"""
-        text  = ''
-        count = 0
-        for sIndex in range(sPluto, self.sCount):
-            sep = self.separations.get(sIndex)
-            if sep <= min_sep:
-                description = '{0} <-> {1}: '.format(self.name, nameFromIndex(pPluto-sIndex))
-                text += '{0:21s} {1:.4f}\n'.format(description, self.separations.get(sIndex))
-                count += 1
-        return count, text
+    return _NAMES[index]
+
+
+# Apparent radii in degrees, by pXXXX index; only the sun and moon are
+# large enough to matter at MAX_SEP scale.
+RADII = [0.25, 0.25, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
+
+# The 45 real pairs of the upper triangle, in the table's traditional
+# print order (each row's partners from Pluto down), precomputed once so
+# every scan is a fancy-index into the dense matrix.
+_PAIRS  = [(i, j) for i in range(pSun, pPluto) for j in range(pPluto, i, -1)]
+_PAIR_I = np.array([p[0] for p in _PAIRS])
+_PAIR_J = np.array([p[1] for p in _PAIRS])
 
 
 class CalculationList:
-    """A list of 10 Calcuations objects, one for each planet."""
+    """ The dense 10x10 table of angular separations for one timestep.
+        All positions are observed from earth at time t; the radius of
+        each body is subtracted from its separations so conjunctions
+        measure limb to limb rather than center to center."""
     def __init__(self, t):
-        self.time = t
-        self.calcs = []
-        self.calcs.append(Calculations(pSun,     sSun,     0.25, t))
-        self.calcs.append(Calculations(pMoon,    sMoon,    0.25, t))
-        self.calcs.append(Calculations(pMercury, sMercury, 0.0,  t))
-        self.calcs.append(Calculations(pVenus,   sVenus,   0.0,  t))
-        self.calcs.append(Calculations(pMars,    sMars,    0.0,  t))
-        self.calcs.append(Calculations(pJupiter, sJupiter, 0.0,  t))
-        self.calcs.append(Calculations(pSaturn,  sSaturn,  0.0,  t))
-        self.calcs.append(Calculations(pUranus,  sUranus,  0.0,  t))
-        self.calcs.append(Calculations(pNeptune, sNeptune, 0.0,  t))
-        self.calcs.append(Calculations(pPluto,   sPluto,   0.0,  t))
+        self.time     = t
+        self.radii    = np.array(RADII)
+        # One barycentric solve for earth serves all ten observations
+        earth_at      = a.earth.at(t)
+        self.locs     = [earth_at.observe(planetFromIndex(p)) for p in range(pSun, pPluto + 1)]
+        self.sep      = None
     def calc(self):
-        for row in self.calcs:
-            row.calc(self)
+        # Stack the ten unit vectors; cos(separation) of every pair is then
+        # one 10x10 matrix product, and one arccos covers all 45 pairs.
+        pos  = np.array([loc.position.au for loc in self.locs])
+        U    = pos / np.linalg.norm(pos, axis=1, keepdims=True)
+        dots = np.clip(U @ U.T, -1.0, 1.0)
+        self.sep = np.abs(np.degrees(np.arccos(dots))
+                          - self.radii[:, None] - self.radii[None, :])
     def get_location(self, pIndex):
-        return self.calcs[pIndex].location
+        return self.locs[pIndex]
     def get_separation(self, p1, p2):
-        i1 = min(p1, p2)
-        i2 = pPluto - max(p1, p2)
-        row = self.calcs[i1]
-        sep = row.separations.get(i2)
-        return '{0:8.4f}  '.format(sep)
+        return '{0:8.4f}  '.format(self.sep[p1, p2])
     def find_conjunctions(self, min_sep):
-        count = 0
+        """search for separations less than or equal to min_sep and return count and text"""
+        # One C-level compare over the 45 pairs; only hits are formatted
+        vals  = self.sep[_PAIR_I, _PAIR_J]
+        hits  = np.nonzero(vals <= min_sep)[0]
+        count = len(hits)
         text  = ''
-        for row in self.calcs:
-            c1, t1 = row.find_conjunctions(min_sep)
-            count += c1
-            text  += t1
+        for k in hits:
+            i, j = _PAIRS[k]
+            description = '{0} <-> {1}: '.format(nameFromIndex(i), nameFromIndex(j))
+            text += '{0:21s} {1:.4f}\n'.format(description, vals[k])
         if count > 0:
             if not PRINT_TABLES:
                 text = '{0}\n'.format(self.time.utc_datetime()) + text
@@ -176,16 +119,19 @@ def calculate_all(t):
         print(header)
         print(separator)
 
+        # Format each row straight from the dense matrix and print the
+        # grid in one write; the old path made a method call and a
+        # separate format per cell, plus a print per row.
+        lines = []
         for pIndex in range(pSun, pPluto):
             pos   = table.get_location(pIndex)
             radec = pos.radec(a.ts.J2000)
-            line  = '{0:10s} {1:15s} {2:15s}  '.format(nameFromIndex(pIndex), str(radec[0]), str(radec[1]))
-            for p2 in range(pSun, pPluto):
-                if pIndex == p2:
-                    line += ' ' * 10
-                else:
-                    line += table.get_separation(pIndex, p2)
-            print(line)
+            row   = table.sep[pIndex]
+            cells = ''.join(' ' * 10 if pIndex == p2 else '{0:8.4f}  '.format(row[p2])
+                            for p2 in range(pSun, pPluto))
+            lines.append('{0:10s} {1:15s} {2:15s}  {3}'.format(
+                nameFromIndex(pIndex), str(radec[0]), str(radec[1]), cells))
+        print('\n'.join(lines))
         print()
 
     count, text = table.find_conjunctions(MAX_SEP)
@@ -196,13 +142,52 @@ def calculate_all(t):
     return count
 
 
+def find_all_conjunctions(t, min_sep):
+    """ Search every timestep of a vector Time t for conjunctions, print
+        them in the same per-timestep format as calculate_all, and return
+        the total count. Each body is observed once for the whole range,
+        so the ephemeris runs 10 vector evaluations instead of one per
+        body per timestep; the separation tensor for all pairs and all
+        timesteps is then a single einsum, clip and arccos."""
+    earth_at = a.earth.at(t)
+    pos   = np.array([earth_at.observe(planetFromIndex(p)).position.au
+                      for p in range(pSun, pPluto + 1)])    # (10, 3, N)
+    U     = pos / np.linalg.norm(pos, axis=1, keepdims=True)
+    dots  = np.clip(np.einsum('ikn,jkn->ijn', U, U), -1.0, 1.0)
+    radii = np.array(RADII)
+    sep   = np.abs(np.degrees(np.arccos(dots))
+                   - radii[:, None, None] - radii[None, :, None])
+    # Only the upper triangle holds real pairs; the diagonal would match
+    # the threshold trivially for the sun and moon.
+    hits  = sep[_PAIR_I, _PAIR_J] <= min_sep                # (45, N)
+    count = 0
+    dts   = t.utc_datetime()
+    for n in np.nonzero(hits.any(axis=0))[0]:
+        text = '{0}\n'.format(dts[n])
+        for k in np.nonzero(hits[:, n])[0]:
+            i, j = _PAIRS[k]
+            description = '{0} <-> {1}: '.format(nameFromIndex(i), nameFromIndex(j))
+            text += '{0:21s} {1:.4f}\n'.format(description, sep[i, j, n])
+            count += 1
+        print(text)
+    return count
+
+
 if '__main__' == __name__:
     x = DAYS_TO_CALC   # How many days to calculate
     dt = a.now().utc_datetime()
-    conj_count = 0
-    for d in range(x):
-        for h in range(24):
-            t = a.ts.utc(dt.year, dt.month, dt.day+d, dt.hour+h, 0, 0)
-            conj_count += calculate_all(t)
+    if PRINT_TABLES:
+        # The tables are rendered per timestep; keep the scalar loop.
+        conj_count = 0
+        for d in range(x):
+            for h in range(24):
+                t = a.ts.utc(dt.year, dt.month, dt.day+d, dt.hour+h, 0, 0)
+                conj_count += calculate_all(t)
+    else:
+        # One vector Time covering every hour of the whole range.
+        days  = np.repeat(np.arange(x), 24)
+        hours = np.tile(np.arange(24), x)
+        t     = a.ts.utc(dt.year, dt.month, dt.day + days, dt.hour + hours, 0, 0)
+        conj_count = find_all_conjunctions(t, MAX_SEP)
     if 0 < conj_count:
         print('Total conjunctions:   {0}'.format(conj_count))